@@ -0,0 +1 @@
+"""Benchmark suite for momo, run with ``python -m benchmarks.suite``."""
@@ -0,0 +1,199 @@
+"""Benchmarks for stepping, neighbor counting, randomizing and rendering.
+
+Every case is timed as the median seconds per call. Results can be saved
+as a JSON baseline and later runs compared against it; the run fails when
+a case is slower than its baseline by more than the threshold::
+
+    python -m benchmarks.suite --quick --save     # record a baseline
+    python -m benchmarks.suite --quick            # check for regressions
+
+Baselines are machine-specific, so record one on the machine that runs
+the comparison.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from momo.display import Display
+from momo.engines import ENGINES, create_game
+
+SIZES: List[Tuple[int, int]] = [(50, 25), (256, 256), (1024, 1024), (4096, 4096)]
+# Largest size run by --quick
+QUICK_SIZE = (256, 256)
+DENSITIES = (0.1, 0.5)
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.2
+# Cells visited per _get_neighbors case, so large grids stay affordable
+NEIGHBOR_SAMPLE = 10_000
+
+# (name, setup) where setup returns the callable to time
+Case = Tuple[str, Callable[[], Callable[[], None]]]
+
+
+def random_grid(width: int, height: int, density: float, seed: int = 0) -> List[List[bool]]:
+    """Return a reproducible grid with about ``density`` of its cells alive."""
+    rng = random.Random(seed)
+    return [[rng.random() < density for _ in range(width)] for _ in range(height)]
+
+
+def _step_case(engine: str, width: int, height: int, density: float) -> Callable[[], None]:
+    game = create_game(engine, width, height)
+    game.grid = random_grid(width, height, density)
+    return game.step
+
+
+def _neighbors_case(engine: str, width: int, height: int, density: float) -> Callable[[], None]:
+    game = create_game(engine, width, height)
+    game.grid = random_grid(width, height, density)
+    cells = [(i % width, i // width % height) for i in range(min(NEIGHBOR_SAMPLE, width * height))]
+
+    def run() -> None:
+        for x, y in cells:
+            game._get_neighbors(x, y)
+    return run
+
+
+def _randomize_case(engine: str, width: int, height: int) -> Callable[[], None]:
+    game = create_game(engine, width, height)
+    return lambda: game.randomize(seed=1)
+
+
+def _render_case(method: str, width: int, height: int, density: float) -> Callable[[], None]:
+    display = Display()
+    grid = random_grid(width, height, density)
+    if method == "render":
+        return lambda: display.render(grid, width, height)
+    if method == "render_with_info":
+        return lambda: display.render_with_info(grid, width, height, 1, False)
+    if method == "render_with_controls":
+        return lambda: display.render_with_controls(grid, width, height, 1, False, "Q:Quit")
+    # render_diff alternates between two successive generations
+    game = create_game("bitboard", width, height)
+    game.grid = grid
+    game.step()
+    frames = [grid, game.grid]
+    calls = iter(range(sys.maxsize))
+    return lambda: display.render_diff(frames[next(calls) % 2], width, height, 1, False)
+
+
+RENDER_METHODS = ("render", "render_with_info", "render_with_controls", "render_diff")
+
+
+def cases(sizes: List[Tuple[int, int]], engines: List[str]) -> Iterator[Case]:
+    """Yield every benchmark case for the given sizes and engines."""
+    for width, height in sizes:
+        size = f"{width}x{height}"
+        for engine in engines:
+            yield (f"randomize[{engine},{size}]",
+                   lambda e=engine, w=width, h=height: _randomize_case(e, w, h))
+            for density in DENSITIES:
+                args = (engine, width, height, density)
+                yield (f"step[{engine},{size},d{density}]", lambda a=args: _step_case(*a))
+                yield (f"get_neighbors[{engine},{size},d{density}]", lambda a=args: _neighbors_case(*a))
+        for method in RENDER_METHODS:
+            for density in DENSITIES:
+                args = (method, width, height, density)
+                yield (f"{method}[{size},d{density}]", lambda a=args: _render_case(*a))
+
+
+def measure(run: Callable[[], None], min_time: float = 0.2, max_rounds: int = 50) -> float:
+    """
+    Return the median seconds per call of ``run``.
+
+    Calls ``run`` once to warm up, then repeatedly until ``min_time`` has
+    elapsed (at least 3 and at most ``max_rounds`` calls).
+    """
+    run()
+    clock = time.perf_counter
+    samples: List[float] = []
+    total = 0.0
+    while len(samples) < 3 or (total < min_time and len(samples) < max_rounds):
+        start = clock()
+        run()
+        elapsed = clock() - start
+        samples.append(elapsed)
+        total += elapsed
+    return statistics.median(samples)
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> List[Tuple[str, float, float]]:
+    """
+    Return the cases slower than their baseline by more than ``threshold``.
+
+    Args:
+        results: Case name -> seconds per call of this run
+        baseline: Case name -> seconds per call recorded earlier
+        threshold: Allowed slowdown as a fraction, e.g. 0.2 for 20%
+
+    Returns:
+        (name, baseline seconds, current seconds) for each regression;
+        cases missing from either side are ignored
+    """
+    return [(name, baseline[name], seconds) for name, seconds in results.items()
+            if name in baseline and seconds > baseline[name] * (1 + threshold)]
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Run the suite and return the process exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Benchmark momo and compare against a stored baseline"
+    )
+    parser.add_argument("--quick", action="store_true",
+                        help=f"Only run sizes up to {QUICK_SIZE[0]}x{QUICK_SIZE[1]}")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                        help="Engine to benchmark, repeatable (default: list)")
+    parser.add_argument("-k", "--filter", default="",
+                        help="Only run cases whose name contains this string")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Baseline JSON file (default: benchmarks/baseline.json)")
+    parser.add_argument("--save", action="store_true",
+                        help="Record this run's results into the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed slowdown before failing (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in SIZES if not args.quick or size[0] * size[1] <= QUICK_SIZE[0] * QUICK_SIZE[1]]
+    baseline: Dict[str, float] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    results: Dict[str, float] = {}
+    stdout = sys.stdout
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        for name, setup in cases(sizes, args.engine or ["list"]):
+            if args.filter not in name:
+                continue
+            # Renders write to the terminal; keep them out of the report
+            sys.stdout = devnull
+            try:
+                seconds = measure(setup())
+            finally:
+                sys.stdout = stdout
+            results[name] = seconds
+            note = ""
+            if name in baseline:
+                note = f"  ({seconds / baseline[name] - 1:+.1%} vs baseline)"
+            print(f"{name:48} {seconds * 1000:12.3f} ms{note}", flush=True)
+
+    if args.save:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
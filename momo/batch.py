@@ -0,0 +1,118 @@
+"""Many same-size Game of Life boards stepped together with NumPy."""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from .numpy_engine import live_cells
+from .rules import Rule, parse_rule
+
+
+class BatchGameOfLife:
+    """``count`` boards of ``height x width`` cells in one ``(N, H, W)`` array.
+
+    Every generation advances all active boards with the same whole-array
+    operations as :class:`~momo.numpy_engine.NumpyGameOfLife`, so the Python
+    overhead is paid once per generation rather than once per board. A board
+    drops out of :attr:`active` when it stops changing or dies out (unless
+    the rule gives birth with no neighbors), since neither can evolve
+    further; :attr:`settled_at` records the generation at which that was
+    detected (-1 while active). Boards wrap toroidally like
+    :class:`~momo.core.GameOfLife`.
+    """
+
+    def __init__(self, count: int, width: int = 50, height: int = 25, rule: str | Rule = "B3/S23"):
+        """
+        Initialize ``count`` empty boards.
+
+        Args:
+            count: Number of boards
+            width: Width of every board
+            height: Height of every board
+            rule: Rule in B/S notation played on every board
+        """
+        if count <= 0:
+            raise ValueError("count must be positive")
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be positive")
+        self.count = count
+        self.width = width
+        self.height = height
+        self.rule = parse_rule(rule)
+        self.generation = 0
+        self.cells = np.zeros((count, height, width), dtype=np.uint8)
+        self.active = np.ones(count, dtype=bool)
+        self.settled_at = np.full(count, -1, dtype=np.int64)
+
+    def randomize(self, seeds: Sequence[int]) -> None:
+        """
+        Fill every board with a random soup and reactivate it.
+
+        Args:
+            seeds: One seed per board for NumPy's default generator
+        """
+        if len(seeds) != self.count:
+            raise ValueError(f"expected {self.count} seeds, got {len(seeds)}")
+        for board, seed in enumerate(seeds):
+            rng = np.random.default_rng(seed)
+            self.cells[board] = rng.integers(0, 2, (self.height, self.width), dtype=np.uint8)
+        self.reset()
+
+    def reset(self) -> None:
+        """Reactivate every board and restart the generation counter."""
+        self.generation = 0
+        self.active[:] = True
+        self.settled_at[:] = -1
+
+    def get_grid(self, board: int) -> List[List[bool]]:
+        """Return one board as rows of booleans."""
+        return self.cells[board].astype(bool).tolist()
+
+    def set_grid(self, board: int, rows: List[List[bool]]) -> None:
+        """Replace one board from rows of booleans and reactivate it."""
+        self.cells[board] = np.array(rows, dtype=np.uint8).reshape(self.height, self.width)
+        self.active[board] = True
+        self.settled_at[board] = -1
+
+    def population(self) -> np.ndarray:
+        """Return the number of live cells of every board."""
+        return self.cells.sum(axis=(1, 2), dtype=np.int64)
+
+    def step(self, n: int = 1) -> None:
+        """
+        Advance every active board ``n`` generations.
+
+        Stops computing once no board is active; the generation counter
+        still advances by ``n``.
+
+        Args:
+            n: Number of generations to advance
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        for done in range(n):
+            boards = np.flatnonzero(self.active)
+            if not boards.size:
+                self.generation += n - done
+                return
+            self.generation += 1
+            # Work on a compact copy unless every board is still active
+            full = boards.size == self.count
+            cells = self.cells if full else self.cells[boards]
+            # Sum each 3x3 block including its center, as in NumpyGameOfLife
+            columns = cells + np.roll(cells, 1, axis=1)
+            columns += np.roll(cells, -1, axis=1)
+            block = columns + np.roll(columns, 1, axis=2)
+            block += np.roll(columns, -1, axis=2)
+            after = live_cells(block, cells, self.rule.terms)
+            moving = (after != cells).any(axis=(1, 2))
+            if 0 not in self.rule.birth:
+                # An empty board stays empty unless cells are born from nothing
+                moving &= after.any(axis=(1, 2))
+            if full:
+                self.cells = after
+            else:
+                self.cells[boards] = after
+            settled = boards[~moving]
+            self.active[settled] = False
+            self.settled_at[settled] = self.generation
@@ -0,0 +1,143 @@
+"""Headless benchmark of the stepping engines."""
+
+import argparse
+import json
+import resource
+import sys
+import time
+from typing import Dict, List
+
+from .engines import ENGINES, create_game
+from .stats import percentile
+
+# Latency percentiles reported by run_benchmark
+PERCENTILES = (50, 90, 99)
+
+
+def peak_rss() -> int:
+    """Return the peak resident set size of this process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_benchmark(width: int = 50, height: int = 25, generations: int = 100,
+                  engine: str = "list", seed: int | None = None) -> Dict[str, object]:
+    """
+    Step a randomized game without a display and measure it.
+
+    Each generation is timed separately with ``step(1)``, so engines that
+    jump several generations at once (``hashlife``) are measured one
+    generation at a time.
+
+    Args:
+        width: Width of the grid
+        height: Height of the grid
+        generations: Generations to step
+        engine: Registered engine name
+        seed: Random seed for the starting grid
+
+    Returns:
+        Dict with the parameters, ``generations_per_sec``, ``cells_per_sec``,
+        ``peak_rss_bytes`` and per-step latencies ``latency_p50`` etc. in
+        seconds
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError("width and height must be positive")
+    if generations <= 0:
+        raise ValueError("generations must be positive")
+    game = create_game(engine, width, height, seed=seed, randomize=True)
+    latencies: List[float] = []
+    try:
+        clock = time.perf_counter
+        for _ in range(generations):
+            start = clock()
+            game.step()
+            latencies.append(clock() - start)
+    finally:
+        close = getattr(game, "close", None)
+        if close is not None:
+            close()
+    elapsed = sum(latencies)
+    rate = generations / elapsed if elapsed else float("inf")
+    result: Dict[str, object] = {
+        "engine": engine,
+        "width": width,
+        "height": height,
+        "generations": generations,
+        "seed": seed,
+        "seconds": elapsed,
+        "generations_per_sec": rate,
+        "cells_per_sec": rate * width * height,
+        "peak_rss_bytes": peak_rss(),
+    }
+    for pct in PERCENTILES:
+        result[f"latency_p{pct}"] = percentile(latencies, pct)
+    return result
+
+
+def format_result(result: Dict[str, object]) -> str:
+    """Return a benchmark result as human-readable lines."""
+    lines = [
+        f"{result['engine']} {result['width']}x{result['height']}, "
+        f"{result['generations']} generations in {result['seconds']:.3f}s",
+        f"  {result['generations_per_sec']:,.1f} generations/s",
+        f"  {result['cells_per_sec']:,.0f} cells/s",
+        f"  peak RSS {result['peak_rss_bytes'] / 2**20:.1f} MiB",
+        "  step latency " + ", ".join(
+            f"p{pct} {result[f'latency_p{pct}'] * 1000:.3f}ms" for pct in PERCENTILES),
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> None:
+    """Entry point for ``momo bench``."""
+    parser = argparse.ArgumentParser(
+        prog="momo bench",
+        description="Step a random grid without a display and report its speed"
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=50,
+        help="Grid width (default: 50)"
+    )
+    parser.add_argument(
+        "--height",
+        type=int,
+        default=25,
+        help="Grid height (default: 25)"
+    )
+    parser.add_argument(
+        "--generations",
+        type=int,
+        default=100,
+        help="Generations to step (default: 100)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default="list",
+        help="Stepping engine (default: list)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for the starting grid"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the result as one JSON object"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        result = run_benchmark(args.width, args.height, args.generations, args.engine, args.seed)
+    except (ValueError, ImportError) as exc:
+        parser.error(str(exc))
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(format_result(result))
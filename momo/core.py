@@ -1,12 +1,106 @@
 """Core Game of Life logic."""
 
-from typing import List, Tuple
+import random
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .rules import Rule, parse_rule
+
+# Maps the 0/1 bytes of ``bytes(row)`` to ASCII digits for ``int(..., 2)``.
+_BIT_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_MASK64 = (1 << 64) - 1
+# Edge handling: wrap around, treat cells beyond the edge as dead, or treat
+# them as reflections of the edge cells
+BOUNDARIES = ("torus", "dead", "mirror")
+
+# (previous, next) position along an axis; None beyond a dead border
+Neighbors = Tuple[Tuple[int | None, int | None], ...]
+
+
+@lru_cache(maxsize=None)
+def axis_neighbors(size: int, boundary: str) -> Neighbors:
+    """
+    Return the (previous, next) neighbor of every position along an axis.
+
+    The table is built once per axis size and boundary mode, so stepping
+    never wraps or clamps a coordinate itself. Under ``"mirror"`` the cell
+    beyond an edge reflects the edge cell, so an edge position is its own
+    neighbor; under ``"dead"`` that neighbor is None and counts as dead.
+
+    Raises:
+        ValueError: If the boundary mode is unknown
+    """
+    if boundary == "torus":
+        return tuple(((i - 1) % size, (i + 1) % size) for i in range(size))
+    if boundary == "mirror":
+        return tuple((max(i - 1, 0), min(i + 1, size - 1)) for i in range(size))
+    if boundary == "dead":
+        return tuple((i - 1 if i > 0 else None, i + 1 if i < size - 1 else None) for i in range(size))
+    raise ValueError(f"unknown boundary {boundary!r} (choose from: {', '.join(BOUNDARIES)})")
+
+
+@lru_cache(maxsize=None)
+def axis_spans(size: int, boundary: str) -> Tuple[Tuple[int, ...], ...]:
+    """Return the positions of every 1x3 neighborhood along an axis, center included."""
+    return tuple(tuple(i for i in (before, center, after) if i is not None)
+                 for center, (before, after) in enumerate(axis_neighbors(size, boundary)))
+
+
+def zobrist_key(index: int) -> int:
+    """
+    Return the 64-bit Zobrist key of the cell at ``index`` (y * width + x).
+
+    Keys are derived with splitmix64 instead of stored in a table, so grids
+    of any size hash without a per-cell allocation.
+    """
+    z = (index * 0x9E3779B97F4A7C15 + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def pack_row(row: List[bool]) -> int:
+    """Pack a row of cells into an int, with bit x holding cell x."""
+    return int(bytes(row[::-1]).translate(_BIT_DIGITS), 2)
+
+
+def unpack_row(bits: int, width: int) -> List[bool]:
+    """Unpack an int produced by :func:`pack_row` into ``width`` cells."""
+    return [digit == "1" for digit in format(bits, f"0{width}b")[::-1]]
 
 
 class GameOfLife:
-    """Conway's Game of Life implementation."""
+    """Conway's Game of Life implementation.
+
+    Any Life-like rule can be played instead of Conway's ``B3/S23`` by
+    passing its B/S notation as ``rule``; see :mod:`momo.rules`. The grid
+    wraps around by default; ``boundary`` selects one of :data:`BOUNDARIES`
+    instead, resolved into neighbor tables once per grid size.
+
+    The grid is split into ``TILE_SIZE`` square tiles. Each generation only
+    re-evaluates tiles that changed in the previous one and their neighbors;
+    stable tiles are carried over untouched. The cells flipped by the last
+    :meth:`step` are published in :attr:`changed`, a set of (x, y) pairs;
+    engines that do not track flips report ``None`` there instead.
+
+    After :meth:`track_cycles`, every step also updates a Zobrist hash of the
+    grid by XOR-ing the keys of the flipped cells, and looks it up in a
+    bounded history of recent hashes. :attr:`cycle_period` is set when the
+    grid repeats: 1 for a still life, p for a period-p oscillator.
+    """
+
+    TILE_SIZE = 8
+    # PhaseStats recording the duration of every step() call, or None
+    stats = None
+    # Generations since the current grid last occurred, or None
+    cycle_period: int | None = None
+    # Zobrist hash of the grid, or None when it must be recomputed
+    _hash: int | None = None
+    # Recent hash -> generation, oldest first, while tracking cycles
+    _history: Dict[int, int] | None = None
 
-    def __init__(self, width: int = 50, height: int = 25, seed: int | None = None, randomize: bool = False):
+    def __init__(self, width: int = 50, height: int = 25, seed: int | None = None,
+                 randomize: bool = False, rule: str | Rule = "B3/S23", boundary: str = "torus"):
         """
         Initialize the Game of Life.
 
@@ -14,68 +108,212 @@ class GameOfLife:
             width: Width of the grid
             height: Height of the grid
             seed: Random seed for reproducible randomization
+            rule: Rule in B/S notation, e.g. ``B36/S23``
+            boundary: Edge handling, one of :data:`BOUNDARIES`
+
+        Raises:
+            ValueError: If the rule is malformed or the boundary unknown
         """
         self.width = width
         self.height = height
+        self.rule = parse_rule(rule)
+        self.boundary = boundary
+        # Neighbor positions along each axis, shared by games of the same size
+        self._x_neighbors = axis_neighbors(width, boundary)
+        self._y_neighbors = axis_neighbors(height, boundary)
+        self._x_spans = axis_spans(width, boundary)
+        self._y_spans = axis_spans(height, boundary)
         self.generation = 0
+        # Per-game generator, so its state can be checkpointed
+        self.rng = random.Random(seed)
+        # Ensure grid is empty; engines allocate their own storage in clear()
+        self.clear()
         if randomize:
             self._randomize(seed)
-        else:
-            # Ensure grid is empty
-            self.grid = [[False for _ in range(width)] for _ in range(height)]
 
     def _randomize(self, seed: int | None = None):
         """Randomize the grid with a given seed for reproducibility."""
-        import random
-
+        rng = self.rng
         if seed is not None:
-            random.seed(seed)
+            rng.seed(seed)
 
-        for row in self.grid:
-            for i in range(len(row)):
-                row[i] = random.choice([True, False])
+        # Build rows fresh and assign them, so engines that keep their cells
+        # in another representation can pack them through the ``grid`` setter.
+        self.grid = [[rng.choice([True, False]) for _ in range(self.width)]
+                     for _ in range(self.height)]
 
     def _get_neighbors(self, x: int, y: int) -> int:
         """
         Count living neighbors for cell at (x, y).
 
-        Uses toroidal (wrapping) boundaries.
-        """
-        count = 0
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = (x + dx) % self.width, (y + dy) % self.height
-                if self.grid[ny][nx]:
-                    count += 1
-        return count
-
-    def step(self) -> None:
-        """Advance to the next generation."""
-        new_grid = [[False for _ in range(self.width)] for _ in range(self.height)]
-
-        for y in range(self.height):
-            for x in range(self.width):
-                neighbors = self._get_neighbors(x, y)
-                is_alive = self.grid[y][x]
-
-                if is_alive:
-                    # Underpopulation: dies if < 2 neighbors
-                    if neighbors < 2:
-                        new_grid[y][x] = False
-                    # Survival: lives if 2 or 3 neighbors
-                    elif neighbors in (2, 3):
-                        new_grid[y][x] = True
-                    # Overpopulation: dies if > 3 neighbors
-                    else:
-                        new_grid[y][x] = False
-                else:
-                    # Reproduction: born if exactly 3 neighbors
-                    if neighbors == 3:
-                        new_grid[y][x] = True
-
-        self.grid = new_grid
+        Neighbor coordinates come from the precomputed tables of the
+        boundary mode, so nothing is wrapped or clamped per cell.
+        """
+        grid = self._grid
+        xs = self._x_spans[x]
+        return sum(grid[ny][nx] for ny in self._y_spans[y] for nx in xs) - grid[y][x]
+
+    def step(self, n: int = 1) -> None:
+        """
+        Advance ``n`` generations.
+
+        Engines run all ``n`` generations inside :meth:`_step`, and the
+        generation counter is updated once at the end. When :attr:`stats`
+        is set, the call is recorded as one ``"step"`` phase.
+
+        Args:
+            n: Number of generations to advance
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if self.stats is None:
+            self._step(n)
+        else:
+            with self.stats.timer("step"):
+                self._step(n)
+        self.generation += n
+        if n and self._history is not None:
+            self._record_hash()
+
+    def advance(self, n: int) -> None:
+        """
+        Advance ``n`` generations.
+
+        Args:
+            n: Number of generations to advance
+        """
+        self.step(n)
+
+    def _step(self, n: int) -> None:
+        """Run ``n`` generations, re-evaluating only tiles near recent changes."""
+        grid = self._grid
+        width, height, size = self.width, self.height, self.TILE_SIZE
+        tiles_x, tiles_y = -(-width // size), -(-height // size)
+        rows_near, spans = self._y_neighbors, self._x_spans
+        # Rows beyond a dead border read as this row of dead cells
+        dead = [False] * width
+        left = [x if before is None else before for x, (before, _) in enumerate(self._x_neighbors)]
+        right = [x if after is None else after for x, (_, after) in enumerate(self._x_neighbors)]
+        # Per tile column: the columns read through left/right, and the ones
+        # missing a neighbor beyond a dead border, counted over their spans
+        columns = []
+        for tx in range(tiles_x):
+            xs = range(tx * size, min(tx * size + size, width))
+            columns.append(([x for x in xs if len(spans[x]) == 3], [x for x in xs if len(spans[x]) < 3]))
+        # Next state indexed by 9 * alive + neighbors
+        table = self.rule.table
+        dirty = self._dirty
+        changed: Set[Tuple[int, int]] = set()
+        for _ in range(n):
+            active = {((tx + dx) % tiles_x, (ty + dy) % tiles_y)
+                      for tx, ty in dirty for dy in (-1, 0, 1) for dx in (-1, 0, 1)}
+            flips = []
+            for tx, ty in active:
+                inner, edges = columns[tx]
+                for y in range(ty * size, min(ty * size + size, height)):
+                    before, after = rows_near[y]
+                    above = dead if before is None else grid[before]
+                    below = dead if after is None else grid[after]
+                    row = grid[y]
+                    for x in inner:
+                        xl, xr = left[x], right[x]
+                        neighbors = (above[xl] + above[x] + above[xr] + row[xl] + row[xr]
+                                     + below[xl] + below[x] + below[xr])
+                        alive = row[x]
+                        if table[9 * alive + neighbors] != alive:
+                            flips.append((x, y))
+                    for x in edges:
+                        neighbors = sum(cells[nx] for cells in (above, row, below) for nx in spans[x]) - row[x]
+                        alive = row[x]
+                        if table[9 * alive + neighbors] != alive:
+                            flips.append((x, y))
+            # Apply flips only after every active cell has read this generation
+            for x, y in flips:
+                grid[y][x] = not grid[y][x]
+            dirty = {(x // size, y // size) for x, y in flips}
+            changed.symmetric_difference_update(flips)
+        self._dirty = dirty
+        self.changed = changed
+
+    def track_cycles(self, history: int = 256) -> None:
+        """
+        Start (or restart) detecting cycles after every step.
+
+        When :meth:`step` advances several generations at once only the
+        final grid is hashed, so the reported period is then a multiple of
+        the true one.
+
+        Args:
+            history: Most recent grid hashes remembered; cycles with longer
+                periods are not detected
+        """
+        if history <= 0:
+            raise ValueError("history must be positive")
+        self._history_size = history
+        self._history = {self.state_hash(): self.generation}
+        self.cycle_period = None
+
+    def state_hash(self) -> int:
+        """Return the Zobrist hash of the grid: the XOR of its live cells' keys."""
+        if self._hash is None:
+            value = 0
+            for y in range(self.height):
+                bits = self.get_row_bits(y)
+                base = y * self.width
+                while bits:
+                    low = bits & -bits
+                    value ^= zobrist_key(base + low.bit_length() - 1)
+                    bits ^= low
+            self._hash = value
+        return self._hash
+
+    def _cell_key(self, x: int, y: int) -> int:
+        """Return the Zobrist key of the cell at (x, y)."""
+        return zobrist_key(y * self.width + x)
+
+    def _record_hash(self) -> None:
+        """Update the hash from the last step's flips and check the history."""
+        changed = self.changed
+        if self._hash is not None and changed is not None:
+            value = self._hash
+            key = self._cell_key
+            for x, y in changed:
+                value ^= key(x, y)
+            self._hash = value
+        else:
+            self._hash = None
+        value = self.state_hash()
+        history = self._history
+        seen = history.pop(value, None)
+        self.cycle_period = self.generation - seen if seen is not None else None
+        history[value] = self.generation
+        if len(history) > self._history_size:
+            del history[next(iter(history))]
+
+    def run_until_cycle(self, max_generations: int) -> int | None:
+        """
+        Step one generation at a time until the grid repeats.
+
+        Args:
+            max_generations: Most generations to run
+
+        Returns:
+            The cycle period, or None if no cycle was found in time
+        """
+        if self._history is None:
+            self.track_cycles()
+        for _ in range(max_generations):
+            self.step()
+            if self.cycle_period is not None:
+                return self.cycle_period
+        return None
+
+    def _edited(self) -> None:
+        """Forget the grid hash and cycle history after a direct edit."""
+        self._hash = None
+        self.cycle_period = None
+        if self._history is not None:
+            self._history.clear()
 
     def randomize(self, seed: int | None = None) -> None:
         """
@@ -87,8 +325,47 @@ class GameOfLife:
         self._randomize(seed)
 
     def clear(self) -> None:
-        """Clear all cells."""
+        """Clear all cells and reset the generation counter."""
+        self._clear()
+        self._edited()
+        self.generation = 0
+
+    def _clear(self) -> None:
+        """Replace the storage with empty cells."""
         self.grid = [[False for _ in range(self.width)] for _ in range(self.height)]
+        # An empty grid is stable, so no tile needs evaluating, unless the
+        # rule gives birth to cells with no neighbors
+        if 0 not in self.rule.birth:
+            self._dirty: Set[Tuple[int, int]] = set()
+        self.changed: Set[Tuple[int, int]] = set()
+
+    @property
+    def grid(self) -> List[List[bool]]:
+        """
+        Rows of booleans, shared with the engine.
+
+        Cells written through the returned rows are seen by the next
+        :meth:`step`, since handing them out marks every tile for
+        re-evaluation and drops the grid hash; read the property again
+        after stepping before writing more. :meth:`set_cell` is cheaper, as
+        it only marks the tile it changes.
+        """
+        self._hash = None
+        self._mark_all_dirty()
+        return self._grid
+
+    @grid.setter
+    def grid(self, rows: List[List[bool]]) -> None:
+        """Replace the grid, marking every tile for re-evaluation."""
+        self._grid = rows
+        self._edited()
+        self._mark_all_dirty()
+
+    def _mark_all_dirty(self) -> None:
+        """Mark every tile for re-evaluation on the next step."""
+        size = self.TILE_SIZE
+        self._dirty = {(tx, ty) for ty in range(-(-self.height // size))
+                       for tx in range(-(-self.width // size))}
 
     def is_paused(self) -> bool:
         """Return whether the simulation is paused."""
@@ -102,10 +379,83 @@ class GameOfLife:
         """Return grid height."""
         return self.height
 
+    def population(self) -> int:
+        """Return the number of live cells."""
+        return sum(self.get_row_bits(y).bit_count() for y in range(self.height))
+
     def get_cell(self, x: int, y: int) -> bool:
         """Get state of cell at (x, y)."""
-        return self.grid[y][x]
+        return self._grid[y][x]
 
     def set_cell(self, x: int, y: int, alive: bool) -> None:
         """Set state of cell at (x, y)."""
-        self.grid[y][x] = alive
\ No newline at end of file
+        self._grid[y][x] = alive
+        self._dirty.add((x // self.TILE_SIZE, y // self.TILE_SIZE))
+        self._edited()
+
+    def get_row_bits(self, y: int) -> int:
+        """Return row y packed into an int, with bit x holding cell (x, y)."""
+        return pack_row(self._grid[y])
+
+    def set_row_bits(self, y: int, bits: int) -> None:
+        """Replace row y from an int packed like :meth:`get_row_bits`."""
+        self._grid[y][:] = unpack_row(bits, self.width)
+        size = self.TILE_SIZE
+        self._dirty.update((tx, y // size) for tx in range(-(-self.width // size)))
+        self._edited()
+
+    def set_rows(self, rows: Iterable[Tuple[int, int]]) -> None:
+        """
+        Replace several rows at once.
+
+        Engines whose per-row writes are expensive override this with a
+        bulk update of their own representation.
+
+        Args:
+            rows: (y, bits) pairs, bits packed like :meth:`get_row_bits`
+        """
+        for y, bits in rows:
+            self.set_row_bits(y, bits)
+
+    def get_region_bits(self, x: int, y: int, width: int, height: int) -> List[int]:
+        """
+        Return a ``width x height`` window of the world as packed rows.
+
+        Bit i of row j holds cell (x + i, y + j). On a torus coordinates wrap
+        around, so the window may start anywhere and be larger than the grid;
+        with any other boundary, cells outside the grid read as dead. Only
+        the rows inside the window are read from the engine.
+        """
+        if self.boundary != "torus":
+            return self._bounded_region_bits(x, y, width, height)
+        world = self.width
+        world_mask = (1 << world) - 1
+        mask = (1 << width) - 1
+        start = x % world
+        rows = []
+        for wy in range(y, y + height):
+            bits = self.get_row_bits(wy % self.height)
+            if start:
+                bits = ((bits >> start) | (bits << (world - start))) & world_mask
+            if width > world:
+                tile, bits = bits, 0
+                for offset in range(0, width, world):
+                    bits |= tile << offset
+            rows.append(bits & mask)
+        return rows
+
+    def _bounded_region_bits(self, x: int, y: int, width: int, height: int) -> List[int]:
+        """Return a window like :meth:`get_region_bits`, dead outside the grid."""
+        mask = (1 << width) - 1
+        rows = []
+        for wy in range(y, y + height):
+            if not 0 <= wy < self.height:
+                rows.append(0)
+                continue
+            bits = self.get_row_bits(wy)
+            rows.append((bits >> x if x >= 0 else bits << -x) & mask)
+        return rows
+
+    def get_region(self, x: int, y: int, width: int, height: int) -> List[List[bool]]:
+        """Return a window of the world as rows of booleans (see :meth:`get_region_bits`)."""
+        return [unpack_row(bits, width) for bits in self.get_region_bits(x, y, width, height)]
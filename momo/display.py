@@ -1,18 +1,78 @@
 """Terminal display for Game of Life."""
 
-from typing import Optional, List
+import sys
+from typing import Dict, Optional, List
+
+# Half-block glyphs indexed by (top cell) | (bottom cell << 1).
+HALF_BLOCK_GLYPHS = " ▀▄█"
+
+
+def _braille_glyph(code: int) -> str:
+    """
+    Return the Braille glyph for a 2x4 block of cells.
+
+    The low nibble of ``code`` holds the left column and the high nibble the
+    right column, top row first.
+    """
+    left, right = code & 0xF, code >> 4
+    dots = (left & 0x7) | (left >> 3) << 6 | (right & 0x7) << 3 | (right >> 3) << 7
+    return chr(0x2800 + dots)
+
+
+BRAILLE_GLYPHS = "".join(_braille_glyph(code) for code in range(256))
+
+# Mode -> (cells per glyph horizontally, cells per glyph vertically)
+MODES = {
+    "cell": (1, 1),
+    "halfblock": (1, 2),
+    "braille": (2, 4),
+}
 
 
 class Display:
-    """Terminal display for the Game of Life."""
+    """Terminal display for the Game of Life.
+
+    In the default ``"cell"`` mode every Life cell is one terminal cell. The
+    ``"halfblock"`` mode packs 1x2 cells into one half-block glyph and
+    ``"braille"`` packs 2x4 cells into one Braille glyph, showing up to 8x
+    more of the world with proportionally smaller frames. Glyphs come from
+    precomputed lookup tables indexed by the packed cells.
+    """
 
     ALIVE_CHAR = "█"
     DEAD_CHAR = "░"
+    # Density shades for zoomed-out viewports (codes 2 and 3 in "cell" mode)
+    SHADE_CHARS = "▒▓"
     CLEAR_SEQ = "\033[2J\033[H"
+    # Fraction of changed cells above which render_diff repaints everything
+    FULL_REPAINT_THRESHOLD = 0.3
+    # Distinct rows kept by the row-string cache before it is reset
+    ROW_CACHE_SIZE = 4096
 
-    def __init__(self):
-        """Initialize the display."""
+    def __init__(self, mode: str = "cell"):
+        """
+        Initialize the display.
+
+        Args:
+            mode: One of ``"cell"``, ``"halfblock"`` or ``"braille"``
+        """
+        if mode not in MODES:
+            raise ValueError(f"unknown display mode {mode!r}")
+        self.mode = mode
+        self._block = MODES[mode]
         self._cursor_visible = True
+        # Last frame emitted by render_diff, or None when the screen is unknown
+        self._last_frame: Optional[List[bytes]] = None
+        self._last_status: Optional[str] = None
+        # Row strings keyed by the row's glyph codes, shared by every render path
+        self._row_cache: Dict[bytes, str] = {}
+        if mode == "cell":
+            glyphs = self.DEAD_CHAR + self.ALIVE_CHAR + self.SHADE_CHARS
+        elif mode == "halfblock":
+            glyphs = HALF_BLOCK_GLYPHS
+        else:
+            glyphs = BRAILLE_GLYPHS
+        self._glyphs = dict(enumerate(glyphs))
 
     def hide_cursor(self) -> None:
         """Hide the cursor."""
@@ -28,6 +88,51 @@ class Display:
     def clear(self) -> None:
         """Clear the terminal screen."""
         print(self.CLEAR_SEQ, end="", flush=True)
+        self._last_frame = None
+
+    def _codes(self, grid: List[List[bool]], width: int, height: int) -> List[bytes]:
+        """
+        Pack the grid into one byte string of glyph codes per screen row.
+
+        Rows of a block are combined as big ints with one byte per cell, so
+        no per-cell Python work is needed: the bytes of row ``dy`` are
+        scaled by ``2**dy`` and summed, which never carries past a byte.
+        """
+        if self.mode == "cell":
+            return [bytes(grid[y][:width]) for y in range(height)]
+        block_width, block_height = self._block
+        frame = []
+        for top in range(0, height, block_height):
+            packed = 0
+            for dy in range(min(block_height, height - top)):
+                packed += int.from_bytes(bytes(grid[top + dy][:width]), "big") << dy
+            codes = packed.to_bytes(width, "big")
+            if block_width == 2:
+                if width % 2:
+                    codes += b"\0"
+                left = int.from_bytes(codes[0::2], "big")
+                right = int.from_bytes(codes[1::2], "big")
+                codes = (left + (right << 4)).to_bytes(len(codes) // 2, "big")
+            frame.append(codes)
+        return frame
+
+    def _row_string(self, codes: bytes) -> str:
+        """Return the glyphs for one screen row, reusing cached strings."""
+        line = self._row_cache.get(codes)
+        if line is None:
+            if len(self._row_cache) >= self.ROW_CACHE_SIZE:
+                self._row_cache.clear()
+            line = codes.decode("latin-1").translate(self._glyphs)
+            self._row_cache[codes] = line
+        return line
+
+    def _write_frame(self, grid: List[List[bool]], width: int, height: int, footer: str) -> None:
+        """Clear the screen and write the grid plus ``footer`` in one write."""
+        rows = [self._row_string(codes) for codes in self._codes(grid, width, height)]
+        rows.append(footer)
+        sys.stdout.write(self.CLEAR_SEQ + "\n".join(rows))
+        sys.stdout.flush()
+        self._last_frame = None
 
     def render(self, grid: List[List[bool]], width: int, height: int) -> None:
         """
@@ -38,18 +143,7 @@ class Display:
             width: Grid width
             height: Grid height
         """
-        # Clear screen
-        self.clear()
-
-        # Render each row
-        for y in range(height):
-            line = ""
-            for x in range(width):
-                if grid[y][x]:
-                    line += self.ALIVE_CHAR
-                else:
-                    line += self.DEAD_CHAR
-            print(line)
+        self._write_frame(grid, width, height, "")
 
     def render_with_info(self, grid: List[List[bool]], width: int, height: int,
                          generation: int, paused: bool) -> None:
@@ -63,22 +157,9 @@ class Display:
             generation: Current generation number
             paused: Whether simulation is paused
         """
-        self.clear()
-
-        # Render grid
-        for y in range(height):
-            line = ""
-            for x in range(width):
-                if grid[y][x]:
-                    line += self.ALIVE_CHAR
-                else:
-                    line += self.DEAD_CHAR
-            print(line)
-
-        # Render status line
         status = "PAUSED" if paused else "RUNNING"
         info = f"Gen: {generation} | {status} | Space:Pause N:Step R:Random C:Clear Q:Quit"
-        print("\n" + info)
+        self._write_frame(grid, width, height, "\n" + info + "\n")
 
     def render_with_controls(self, grid: List[List[bool]], width: int, height: int,
                              generation: int, paused: bool, controls: Optional[str] = None) -> None:
@@ -93,23 +174,75 @@ class Display:
             paused: Whether simulation is paused
             controls: Additional control hints
         """
-        self.clear()
-
-        # Render grid
-        for y in range(height):
-            line = ""
-            for x in range(width):
-                if grid[y][x]:
-                    line += self.ALIVE_CHAR
-                else:
-                    line += self.DEAD_CHAR
-            print(line)
-
-        # Render status line
         status = "PAUSED" if paused else "RUNNING"
-        base_info = f"Gen: {generation} | {status}"
-        print("\n" + base_info)
-
+        footer = "\n" + f"Gen: {generation} | {status}" + "\n"
         # Render controls if provided
         if controls:
-            print(controls)
\ No newline at end of file
+            footer += controls + "\n"
+        self._write_frame(grid, width, height, footer)
+
+    def render_diff(self, grid: List[List[bool]], width: int, height: int,
+                    generation: int, paused: bool, stats: Optional[str] = None) -> None:
+        """
+        Render the grid with status information, repainting only changes.
+
+        Remembers the last frame it emitted and writes cursor moves plus
+        glyphs for the screen cells that differ from it. Falls back to a full
+        repaint on the first frame, after a size change, or when more than
+        ``FULL_REPAINT_THRESHOLD`` of the screen cells changed.
+
+        Args:
+            grid: 2D grid of boolean values
+            width: Grid width
+            height: Grid height
+            generation: Current generation number
+            paused: Whether simulation is paused
+            stats: Timing summary shown next to the generation, if any
+        """
+        status = "PAUSED" if paused else "RUNNING"
+        if stats:
+            status = f"{stats} | {status}"
+        info = f"Gen: {generation} | {status} | Space:Pause N:Step R:Random C:Clear Q:Quit"
+        frame = self._codes(grid, width, height)
+        last = self._last_frame
+        if last is None or len(last) != len(frame) or (frame and len(last[0]) != len(frame[0])):
+            self._repaint(frame, info)
+            return
+
+        out = []
+        columns = len(frame[0]) if frame else 0
+        budget = self.FULL_REPAINT_THRESHOLD * columns * len(frame)
+        changed = 0
+        for y, (row, old) in enumerate(zip(frame, last)):
+            if row == old:
+                continue
+            x = 0
+            while x < columns:
+                if row[x] == old[x]:
+                    x += 1
+                    continue
+                # Emit one cursor move for each run of changed glyphs
+                start = x
+                while x < columns and row[x] != old[x]:
+                    x += 1
+                changed += x - start
+                run = row[start:x].decode("latin-1").translate(self._glyphs)
+                out.append(f"\033[{y + 1};{start + 1}H{run}")
+            if changed > budget:
+                self._repaint(frame, info)
+                return
+        if info != self._last_status:
+            out.append(f"\033[{len(frame) + 2};1H{info}\033[K")
+            self._last_status = info
+        self._last_frame = frame
+        if out:
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+
+    def _repaint(self, frame: List[bytes], info: str) -> None:
+        """Clear the screen and write a whole frame plus status line."""
+        rows = [self._row_string(row) for row in frame]
+        sys.stdout.write(self.CLEAR_SEQ + "\n".join(rows) + "\n\n" + info)
+        sys.stdout.flush()
+        self._last_frame = frame
+        self._last_status = info
@@ -0,0 +1,55 @@
+"""Registry of interchangeable Game of Life engines."""
+
+import importlib
+from typing import Dict, Type
+
+from .core import GameOfLife
+
+# Engine name -> "module:class". Modules are imported on first use so that
+# engines with optional dependencies only fail when they are requested.
+ENGINES: Dict[str, str] = {
+    "list": "momo.core:GameOfLife",
+    "numpy": "momo.numpy_engine:NumpyGameOfLife",
+    "bitboard": "momo.bitboard:BitboardGameOfLife",
+    "sparse": "momo.sparse:SparseGameOfLife",
+    "hashlife": "momo.hashlife:HashLifeGameOfLife",
+    "parallel": "momo.parallel:ParallelGameOfLife",
+    "mmap": "momo.mmap_engine:MappedGameOfLife",
+}
+
+
+def get_engine(name: str) -> Type[GameOfLife]:
+    """
+    Return the engine class registered under ``name``.
+
+    Raises:
+        ValueError: If no engine has that name
+        ImportError: If the engine's optional dependency is not installed
+    """
+    try:
+        target = ENGINES[name]
+    except KeyError:
+        choices = ", ".join(sorted(ENGINES))
+        raise ValueError(f"unknown engine {name!r} (choose from: {choices})") from None
+    module_name, class_name = target.split(":")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as exc:
+        raise ImportError(f"engine {name!r} is unavailable: {exc}") from exc
+    return getattr(module, class_name)
+
+
+def create_game(engine: str = "list", width: int = 50, height: int = 25,
+                seed: int | None = None, randomize: bool = False, **options) -> GameOfLife:
+    """
+    Create a game backed by the named engine.
+
+    Args:
+        engine: Registered engine name
+        width: Width of the grid
+        height: Height of the grid
+        seed: Random seed for reproducible randomization
+        randomize: Whether to start from a random grid
+        **options: Engine-specific keyword arguments
+    """
+    return get_engine(engine)(width, height, seed, randomize, **options)
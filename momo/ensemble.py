@@ -0,0 +1,165 @@
+"""Statistics over many random soups, fanned out over a process pool."""
+
+import argparse
+import json
+import os
+from multiprocessing import Pool
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .engines import ENGINES, create_game
+from .rules import parse_rule
+
+# (seed, width, height, max_generations, engine, rule)
+Task = Tuple[int, int, int, int, str, str]
+
+
+def summarize_seed(task: Task) -> Dict[str, object]:
+    """
+    Run one random soup until it settles or hits the generation limit.
+
+    Returns:
+        Dict with the ``seed``, whether it ``stabilized``, its ``lifespan``
+        (first generation of the final still life or oscillator, or the
+        limit), the cycle ``period``, and ``initial_population`` and
+        ``final_population``
+    """
+    seed, width, height, max_generations, engine, rule = task
+    game = create_game(engine, width, height, seed=seed, randomize=True, rule=rule)
+    try:
+        initial = game.population()
+        period = game.run_until_cycle(max_generations)
+        return {
+            "seed": seed,
+            "stabilized": period is not None,
+            "lifespan": game.generation - period if period is not None else game.generation,
+            "period": period,
+            "initial_population": initial,
+            "final_population": game.population(),
+        }
+    finally:
+        close = getattr(game, "close", None)
+        if close is not None:
+            close()
+
+
+def run_ensemble(seeds: Iterable[int], width: int = 50, height: int = 25,
+                 max_generations: int = 1000, engine: str = "bitboard",
+                 workers: int | None = None, chunksize: int | None = None,
+                 rule: str = "B3/S23") -> Iterator[Dict[str, object]]:
+    """
+    Summarize one random soup per seed, in parallel.
+
+    Seeds are handed to the workers in chunks, and summaries are yielded
+    as soon as they are ready, in the order of ``seeds``. Each summary only
+    depends on its seed, so the output is identical for any worker count.
+
+    Args:
+        seeds: Seeds of the soups
+        width: Width of each grid
+        height: Height of each grid
+        max_generations: Generations after which an unsettled soup is cut off
+        engine: Registered engine name
+        workers: Worker processes (default: CPU count); 1 runs in-process
+        chunksize: Seeds per task sent to a worker (default: about four
+            chunks per worker)
+        rule: Rule in B/S notation
+
+    Yields:
+        The :func:`summarize_seed` dict of every seed
+    """
+    seeds = list(seeds)
+    if width <= 0 or height <= 0:
+        raise ValueError("width and height must be positive")
+    if max_generations <= 0:
+        raise ValueError("max_generations must be positive")
+    # Fail on a bad rule here rather than in every worker
+    rule = parse_rule(rule).notation
+    tasks = [(seed, width, height, max_generations, engine, rule) for seed in seeds]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    if workers == 1:
+        yield from map(summarize_seed, tasks)
+        return
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * 4))
+    with Pool(workers) as pool:
+        yield from pool.imap(summarize_seed, tasks, chunksize)
+
+
+def parse_seeds(text: str) -> List[int]:
+    """
+    Parse a seed list such as ``"0-99,200,300-310"`` (ranges are inclusive).
+
+    Raises:
+        ValueError: If the list is malformed
+    """
+    seeds = []
+    for part in text.split(","):
+        start, sep, end = part.strip().partition("-")
+        if sep:
+            seeds.extend(range(int(start), int(end) + 1))
+        else:
+            seeds.append(int(start))
+    return seeds
+
+
+def main(argv: List[str] | None = None) -> None:
+    """Entry point for ``momo ensemble``."""
+    parser = argparse.ArgumentParser(
+        prog="momo ensemble",
+        description="Run one random soup per seed in parallel and print a JSON summary per line"
+    )
+    parser.add_argument(
+        "--seeds",
+        default="0-99",
+        help="Seeds as a comma-separated list of numbers and inclusive ranges (default: 0-99)"
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=50,
+        help="Grid width (default: 50)"
+    )
+    parser.add_argument(
+        "--height",
+        type=int,
+        default=25,
+        help="Grid height (default: 25)"
+    )
+    parser.add_argument(
+        "--generations",
+        type=int,
+        default=1000,
+        help="Generations after which an unsettled soup is cut off (default: 1000)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default="bitboard",
+        help="Stepping engine (default: bitboard)"
+    )
+    parser.add_argument(
+        "--rule",
+        default="B3/S23",
+        help="Life-like rule in B/S notation (default: B3/S23)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Seeds sent to a worker at a time (default: about four chunks per worker)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        seeds = parse_seeds(args.seeds)
+        for summary in run_ensemble(seeds, args.width, args.height, args.generations,
+                                    args.engine, args.workers, args.chunksize, args.rule):
+            print(json.dumps(summary), flush=True)
+    except (ValueError, ImportError) as exc:
+        parser.error(str(exc))
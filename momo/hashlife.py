@@ -0,0 +1,400 @@
+"""HashLife engine: memoized quadtree for exponential fast-forward."""
+
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .core import GameOfLife, pack_row, zobrist_key
+from .rules import Rule, parse_rule
+
+
+class Node:
+    """Immutable quadtree node covering a ``2**level`` square of cells.
+
+    Nodes are hash-consed by :class:`HashLifeGameOfLife`, so two nodes with
+    the same children are the same object and can be compared by identity.
+    ``key`` caches a hash of the node's cells once it is first needed.
+    """
+
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population", "key")
+
+    def __init__(self, level: int, nw: Optional["Node"], ne: Optional["Node"],
+                 sw: Optional["Node"], se: Optional["Node"], population: int):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+        self.key: int | None = None
+
+
+# Level-0 leaves are shared by every engine instance.
+OFF = Node(0, None, None, None, None, 0)
+ON = Node(0, None, None, None, None, 1)
+
+
+class HashLifeGameOfLife(GameOfLife):
+    """Game of Life on an unbounded plane using Gosper's HashLife.
+
+    The universe is a quadtree of hash-consed :class:`Node` objects centered
+    on the origin. Results of advancing a node are memoized, so repetitive
+    patterns can jump ``2**j`` generations in one call (see :meth:`advance`).
+    ``width`` and ``height`` only size the window exposed through ``grid``,
+    which starts at (0, 0); cells outside it keep evolving.
+
+    Memory is bounded in two ways: the results cache drops its oldest half
+    once it holds ``max_cache`` entries, and between jumps the node table is
+    garbage collected down to the live tree once it exceeds ``max_nodes``.
+
+    Flipped cells are not tracked, so :attr:`changed` is always ``None``.
+    """
+
+    changed = None
+
+    def __init__(self, width: int = 50, height: int = 25, seed: int | None = None,
+                 randomize: bool = False, rule: str | Rule = "B3/S23", boundary: str = "torus",
+                 max_nodes: int = 1_000_000, max_cache: int = 1_000_000):
+        """
+        Initialize the HashLife Game of Life.
+
+        Args:
+            width: Width of the visible window
+            height: Height of the visible window
+            seed: Random seed for reproducible randomization
+            rule: Rule in B/S notation; it may not give birth with 0 neighbors
+            boundary: Accepted for a uniform signature; the plane has no edges,
+                so only the default is allowed
+            max_nodes: Node table size that triggers garbage collection
+            max_cache: Results cache size that triggers eviction
+
+        Raises:
+            ValueError: If the rule is malformed or contains B0, or a
+                boundary other than the default is requested
+        """
+        if 0 in parse_rule(rule).birth:
+            raise ValueError("the hashlife engine assumes empty space stays empty and cannot play B0 rules")
+        if boundary != "torus":
+            raise ValueError("the hashlife engine runs on an unbounded plane and has no boundary modes")
+        self.max_nodes = max_nodes
+        self.max_cache = max_cache
+        self._nodes: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        self._cache: Dict[Tuple[Node, int], Node] = {}
+        self._empty: List[Node] = [OFF]
+        super().__init__(width, height, seed, randomize, rule, boundary)
+
+    # Quadtree construction
+
+    def _join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """Return the canonical node with the given quadrants."""
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw.level + 1, nw, ne, sw, se, population)
+            self._nodes[key] = node
+        return node
+
+    def _empty_node(self, level: int) -> Node:
+        """Return the empty node of the given level."""
+        while len(self._empty) <= level:
+            empty = self._empty[-1]
+            self._empty.append(self._join(empty, empty, empty, empty))
+        return self._empty[level]
+
+    def _expand(self, node: Node) -> Node:
+        """Return a node one level up with ``node`` in its center."""
+        empty = self._empty_node(node.level - 1)
+        return self._join(
+            self._join(empty, empty, empty, node.nw),
+            self._join(empty, empty, node.ne, empty),
+            self._join(empty, node.sw, empty, empty),
+            self._join(node.se, empty, empty, empty),
+        )
+
+    @staticmethod
+    def _center(node: Node) -> Tuple[Node, Node, Node, Node]:
+        """Return the quadrants of the centered node one level down."""
+        return node.nw.se, node.ne.sw, node.sw.ne, node.se.nw
+
+    def _build(self, rows: List[List[bool]], x: int, y: int, level: int) -> Node:
+        """Build the node of ``level`` whose top-left corner is (x, y) in ``rows``."""
+        if y >= self.height or x >= self.width:
+            return self._empty_node(level)
+        if level == 0:
+            return ON if rows[y][x] else OFF
+        half = 1 << (level - 1)
+        return self._join(
+            self._build(rows, x, y, level - 1),
+            self._build(rows, x + half, y, level - 1),
+            self._build(rows, x, y + half, level - 1),
+            self._build(rows, x + half, y + half, level - 1),
+        )
+
+    def _set(self, node: Node, x: int, y: int, alive: bool) -> Node:
+        """Return ``node`` with the cell at (x, y) relative to its corner set."""
+        if node.level == 0:
+            return ON if alive else OFF
+        half = 1 << (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if y < half:
+            if x < half:
+                nw = self._set(nw, x, y, alive)
+            else:
+                ne = self._set(ne, x - half, y, alive)
+        elif x < half:
+            sw = self._set(sw, x, y - half, alive)
+        else:
+            se = self._set(se, x - half, y - half, alive)
+        return self._join(nw, ne, sw, se)
+
+    def _fill(self, node: Node, x: int, y: int, rows: List[List[bool]]) -> None:
+        """Mark live cells of ``node``, cornered at (x, y) relative to ``rows``, in ``rows``."""
+        size = 1 << node.level
+        if (node.population == 0 or y >= len(rows) or x >= len(rows[0])
+                or x + size <= 0 or y + size <= 0):
+            return
+        if node.level == 0:
+            rows[y][x] = True
+            return
+        half = size >> 1
+        self._fill(node.nw, x, y, rows)
+        self._fill(node.ne, x + half, y, rows)
+        self._fill(node.sw, x, y + half, rows)
+        self._fill(node.se, x + half, y + half, rows)
+
+    # Evolution
+
+    def _life_4x4(self, node: Node) -> Node:
+        """Advance the center 2x2 of a level-2 node by one generation."""
+        cells = [[0] * 4 for _ in range(4)]
+        for qx, qy, quadrant in ((0, 0, node.nw), (2, 0, node.ne), (0, 2, node.sw), (2, 2, node.se)):
+            cells[qy][qx] = quadrant.nw.population
+            cells[qy][qx + 1] = quadrant.ne.population
+            cells[qy + 1][qx] = quadrant.sw.population
+            cells[qy + 1][qx + 1] = quadrant.se.population
+        # Next state indexed by 8 * alive + block total
+        table = self.rule.table
+        result = []
+        for y, x in ((1, 1), (1, 2), (2, 1), (2, 2)):
+            block = (sum(cells[y - 1][x - 1:x + 2]) + sum(cells[y][x - 1:x + 2])
+                     + sum(cells[y + 1][x - 1:x + 2]))
+            result.append(ON if table[8 * cells[y][x] + block] else OFF)
+        return self._join(*result)
+
+    def _successor(self, node: Node, j: int) -> Node:
+        """
+        Return the center of ``node`` advanced ``2**j`` generations.
+
+        ``j`` is clamped to ``node.level - 2``, the largest jump whose result
+        is fully determined by the node's contents.
+        """
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        key = (node, j)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            join = self._join
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # Nine overlapping subnodes one level down, each advanced once.
+            c1 = self._successor(nw, j)
+            c2 = self._successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = self._successor(ne, j)
+            c4 = self._successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = self._successor(join(*self._center(node)), j)
+            c6 = self._successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = self._successor(sw, j)
+            c8 = self._successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = self._successor(se, j)
+            if j < node.level - 2:
+                # The first half already covers the jump: take the centers.
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw),
+                    join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw),
+                    join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                result = join(
+                    self._successor(join(c1, c2, c4, c5), j),
+                    self._successor(join(c2, c3, c5, c6), j),
+                    self._successor(join(c4, c5, c7, c8), j),
+                    self._successor(join(c5, c6, c8, c9), j),
+                )
+        if len(self._cache) >= self.max_cache:
+            for stale in list(islice(self._cache, len(self._cache) // 2)):
+                del self._cache[stale]
+        self._cache[key] = result
+        return result
+
+    def _crop(self, node: Node) -> Node:
+        """Return the smallest centered node (of level 3 or more) holding every live cell of ``node``."""
+        while node.level > 3 and self._join(*self._center(node)).population == node.population:
+            node = self._join(*self._center(node))
+        return node
+
+    def _node_key(self, node: Node) -> int:
+        """Return a 64-bit hash of the cells under ``node``, memoized on the node."""
+        if node.key is None:
+            if node.level == 0:
+                node.key = zobrist_key(node.population)
+            else:
+                value = node.level
+                for child in (node.nw, node.ne, node.sw, node.se):
+                    value = zobrist_key(value ^ self._node_key(child))
+                node.key = value
+        return node.key
+
+    def _is_padded(self, node: Node) -> bool:
+        """Return whether every live cell of ``node`` is in its central quarter."""
+        quarter = self._join(*self._center(self._join(*self._center(node))))
+        return quarter.population == node.population
+
+    def _jump(self, j: int) -> None:
+        """Advance the universe by exactly ``2**j`` generations."""
+        root = self.root
+        # Pad until the pattern sits in the central quarter, then once more so
+        # nothing can grow out of the half that _successor returns.
+        while root.level < j + 2 or not self._is_padded(root):
+            root = self._expand(root)
+        root = self._successor(self._expand(root), j)
+        # Crop empty borders so later jumps start from a small tree.
+        self.root = self._crop(root)
+        if len(self._nodes) > self.max_nodes:
+            self._collect()
+
+    def _collect(self) -> None:
+        """Drop the results cache and every node not reachable from the root."""
+        self._cache.clear()
+        keep: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        stack = [self.root] + self._empty[1:]
+        while stack:
+            node = stack.pop()
+            key = (node.nw, node.ne, node.sw, node.se)
+            if node.level == 0 or key in keep:
+                continue
+            keep[key] = node
+            stack.extend(key)
+        self._nodes = keep
+
+    def _step(self, n: int) -> None:
+        """
+        Run ``n`` generations, one power-of-two jump per set bit of ``n``.
+
+        ``advance(2**20)`` therefore costs about as much as a few dozen
+        generations of a stable pattern.
+        """
+        j = 0
+        while n:
+            if n & 1:
+                self._jump(j)
+            n >>= 1
+            j += 1
+
+    # GameOfLife surface
+
+    @property
+    def grid(self) -> List[List[bool]]:
+        """Return the ``width x height`` window at the origin as rows of booleans."""
+        rows = [[False] * self.width for _ in range(self.height)]
+        offset = -(1 << (self.root.level - 1))
+        self._fill(self.root, offset, offset, rows)
+        return rows
+
+    @grid.setter
+    def grid(self, rows: List[List[bool]]) -> None:
+        """Replace the universe with the cells set in ``rows``."""
+        level = max(3, (max(self.width, self.height) - 1).bit_length() + 1)
+        empty = self._empty_node(level - 1)
+        # The window starts at the origin, i.e. in the south-east quadrant.
+        self.root = self._join(empty, empty, empty, self._build(rows, 0, 0, level - 1))
+        self._edited()
+
+    def _clear(self) -> None:
+        """Replace the storage with empty cells."""
+        self.root = self._empty_node(3)
+
+    def state_hash(self) -> int:
+        """
+        Return a hash of the whole universe, not only of the window.
+
+        The root is centered on the origin, so once cropped to its live
+        cells it identifies the universe; its key is built from the keys of
+        its children, which are memoized on the shared nodes, so only the
+        nodes created since the last hash are visited.
+        """
+        if self._hash is None:
+            self._hash = self._node_key(self._crop(self.root))
+        return self._hash
+
+    def population(self) -> int:
+        """Return the number of live cells in the whole universe."""
+        return self.root.population
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get state of cell at (x, y)."""
+        node = self.root
+        half = 1 << (node.level - 1)
+        x += half
+        y += half
+        if not (0 <= x < 2 * half and 0 <= y < 2 * half):
+            return False
+        while node.level > 0 and node.population:
+            half = 1 << (node.level - 1)
+            if y < half:
+                node = node.nw if x < half else node.ne
+            else:
+                node = node.sw if x < half else node.se
+                y -= half
+            if x >= half:
+                x -= half
+        return node.population == 1
+
+    def set_cell(self, x: int, y: int, alive: bool) -> None:
+        """Set state of cell at (x, y)."""
+        root = self.root
+        while not (-(1 << (root.level - 1)) <= min(x, y) and max(x, y) < (1 << (root.level - 1))):
+            root = self._expand(root)
+        half = 1 << (root.level - 1)
+        self.root = self._set(root, x + half, y + half, alive)
+        self._edited()
+
+    def get_row_bits(self, y: int) -> int:
+        """Return row y of the window packed into an int, with bit x holding cell (x, y)."""
+        return self.get_region_bits(0, y, self.width, 1)[0]
+
+    def get_region_bits(self, x: int, y: int, width: int, height: int) -> List[int]:
+        """
+        Return a ``width x height`` window of the plane as packed rows.
+
+        Empty quadrants are skipped, so sparse windows are cheap to read.
+        """
+        rows = [[False] * width for _ in range(height)]
+        offset = -(1 << (self.root.level - 1))
+        self._fill(self.root, offset - x, offset - y, rows)
+        return [pack_row(row) for row in rows]
+
+    def set_row_bits(self, y: int, bits: int) -> None:
+        """Replace row y of the window from an int packed like :meth:`get_row_bits`."""
+        for x in range(self.width):
+            self.set_cell(x, y, bool((bits >> x) & 1))
+
+    def set_rows(self, rows: Iterable[Tuple[int, int]]) -> None:
+        """Replace several rows of the window, touching only the cells that flip."""
+        mask = (1 << self.width) - 1
+        for y, bits in rows:
+            bits &= mask
+            flips = bits ^ self.get_row_bits(y)
+            while flips:
+                low = flips & -flips
+                self.set_cell(low.bit_length() - 1, y, bool(bits & low))
+                flips ^= low
+
+    def _get_neighbors(self, x: int, y: int) -> int:
+        """Count living neighbors for cell at (x, y)."""
+        return sum(self.get_cell(x + dx, y + dy)
+                   for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
@@ -0,0 +1,152 @@
+"""Out-of-core Game of Life engine over a memory-mapped, bit-packed file."""
+
+import mmap
+import tempfile
+import weakref
+from typing import BinaryIO, List
+
+from .bitboard import COLUMN_SHIFTS, next_row
+from .core import GameOfLife, pack_row, unpack_row
+from .rules import Rule
+
+
+class MappedGameOfLife(GameOfLife):
+    """Game of Life whose grid lives in a memory-mapped file.
+
+    Row y occupies ``ceil(width / 8)`` bytes at offset ``y * row_bytes``,
+    bit x of its little-endian integer holding cell x. A generation is
+    computed in place, top to bottom, with a sliding window of three rows:
+    each new row is written over the old one, and only the old row above
+    and the old first row (for the wrap at the bottom) are kept in memory.
+    Memory use is therefore a few rows regardless of the world size, I/O is
+    one sequential pass per generation, and the kernel can evict pages of
+    the mapping at will.
+
+    Tracking every flipped cell would need memory proportional to the
+    activity of the whole world, so :attr:`changed` is ``None``.
+    """
+
+    changed = None
+
+    def __init__(self, width: int = 50, height: int = 25, seed: int | None = None,
+                 randomize: bool = False, rule: str | Rule = "B3/S23", boundary: str = "torus",
+                 path: str | None = None):
+        """
+        Initialize the memory-mapped Game of Life.
+
+        Args:
+            width: Width of the grid
+            height: Height of the grid
+            seed: Random seed for reproducible randomization
+            rule: Rule in B/S notation
+            boundary: Edge handling, one of :data:`~momo.core.BOUNDARIES`
+            path: File backing the grid; it is created or truncated to
+                ``height * ceil(width / 8)`` bytes. Defaults to an anonymous
+                temporary file.
+        """
+        self._row_bytes = (width + 7) // 8
+        size = max(1, height * self._row_bytes)
+        self._file: BinaryIO = open(path, "w+b") if path else tempfile.TemporaryFile()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        if hasattr(self._map, "madvise"):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+        self._finalizer = weakref.finalize(self, MappedGameOfLife._release, self._map, self._file)
+        super().__init__(width, height, seed, randomize, rule, boundary)
+
+    @staticmethod
+    def _release(mapping: mmap.mmap, file: BinaryIO) -> None:
+        """Write back and unmap the grid, then close its file."""
+        mapping.flush()
+        mapping.close()
+        file.close()
+
+    def close(self) -> None:
+        """Write the grid back to its file and release the mapping."""
+        self._finalizer()
+
+    def __enter__(self) -> "MappedGameOfLife":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _step(self, n: int) -> None:
+        """Run ``n`` generations, each as one in-place pass over the rows."""
+        mapping = self._map
+        row_bytes = self._row_bytes
+        width, height, rule = self.width, self.height, self.rule
+        shifts = COLUMN_SHIFTS[self.boundary]
+        mask = (1 << width) - 1
+        last = height - 1
+        # Rows read above the first and below the last: wrapped, repeated or dead
+        top, bottom = self._y_neighbors[0][0], self._y_neighbors[last][1]
+        for _ in range(n):
+            first = self.get_row_bits(0)
+            above, row = 0 if top is None else self.get_row_bits(top), first
+            for y in range(height):
+                if y < last:
+                    below = self.get_row_bits(y + 1)
+                else:
+                    # The old first row was overwritten, so use the saved copy
+                    below = 0 if bottom is None else first if bottom == 0 else row
+                offset = y * row_bytes
+                mapping[offset:offset + row_bytes] = next_row(above, row, below, width, mask, rule, shifts).to_bytes(
+                    row_bytes, "little")
+                above, row = row, below
+
+    @property
+    def grid(self) -> List[List[bool]]:
+        """Return the grid as rows of booleans (only sensible for small grids)."""
+        return [unpack_row(self.get_row_bits(y), self.width) for y in range(self.height)]
+
+    @grid.setter
+    def grid(self, rows: List[List[bool]]) -> None:
+        """Replace the grid from rows of booleans."""
+        for y, row in enumerate(rows):
+            self.set_row_bits(y, pack_row(row))
+
+    def _clear(self) -> None:
+        """Zero the mapped rows by dropping the file's blocks, without touching its pages."""
+        size = len(self._map)
+        self._file.truncate(0)
+        self._file.truncate(size)
+
+    def _randomize(self, seed: int | None = None) -> None:
+        """Randomize the grid one row at a time, drawing cells like the other engines."""
+        rng = self.rng
+        if seed is not None:
+            rng.seed(seed)
+        choices = [True, False]
+        for y in range(self.height):
+            self.set_row_bits(y, pack_row([rng.choice(choices) for _ in range(self.width)]))
+
+    def _get_neighbors(self, x: int, y: int) -> int:
+        """Count living neighbors for cell at (x, y) from the boundary's tables."""
+        xs = self._x_spans[x]
+        return sum(self.get_cell(nx, ny) for ny in self._y_spans[y] for nx in xs) - self.get_cell(x, y)
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get state of cell at (x, y)."""
+        return bool((self._map[y * self._row_bytes + x // 8] >> (x % 8)) & 1)
+
+    def set_cell(self, x: int, y: int, alive: bool) -> None:
+        """Set state of cell at (x, y)."""
+        index = y * self._row_bytes + x // 8
+        if alive:
+            self._map[index] |= 1 << (x % 8)
+        else:
+            self._map[index] &= ~(1 << (x % 8)) & 0xFF
+        self._edited()
+
+    def get_row_bits(self, y: int) -> int:
+        """Return row y packed into an int, with bit x holding cell (x, y)."""
+        offset = y * self._row_bytes
+        return int.from_bytes(self._map[offset:offset + self._row_bytes], "little")
+
+    def set_row_bits(self, y: int, bits: int) -> None:
+        """Replace row y from an int packed like :meth:`get_row_bits`."""
+        offset = y * self._row_bytes
+        bits &= (1 << self.width) - 1
+        self._map[offset:offset + self._row_bytes] = bits.to_bytes(self._row_bytes, "little")
+        self._edited()
@@ -0,0 +1,110 @@
+"""NumPy-vectorized Game of Life engine."""
+
+from typing import List, Set, Tuple
+
+import numpy as np
+
+from .core import GameOfLife
+from .rules import BlockTerms
+
+# Boundary mode -> np.pad mode that fills the ring of cells around the grid
+PAD_MODES = {"torus": "wrap", "dead": "constant", "mirror": "edge"}
+
+
+def live_cells(block: np.ndarray, cells: np.ndarray, terms: BlockTerms) -> np.ndarray:
+    """
+    Apply a rule to whole arrays of 3x3 block totals.
+
+    Args:
+        block: Block totals, center included
+        cells: Current cells (0 or 1), shaped like ``block``
+        terms: :attr:`Rule.terms` of the rule
+
+    Returns:
+        The next cells as a ``uint8`` array
+    """
+    after = np.zeros(block.shape, dtype=bool)
+    for total, center in terms:
+        hit = block == total
+        if center is not None:
+            hit &= cells == center
+        after |= hit
+    return after.view(np.uint8)
+
+
+class NumpyGameOfLife(GameOfLife):
+    """Game of Life that steps the whole grid with NumPy array operations.
+
+    Cells live in a ``(height, width)`` ``uint8`` array. Neighbor counts are
+    sums of shifted views of a copy padded by one cell on every side; the
+    pad mode realizes the boundary, e.g. wrapped for the toroidal default of
+    :class:`GameOfLife`. The ``grid``/``get_cell``/``set_cell`` surface
+    is unchanged, which lets :class:`TerminalInterface` drive either engine.
+    """
+
+    @property
+    def grid(self) -> List[List[bool]]:
+        """Return the grid as rows of booleans."""
+        return self.cells.astype(bool).tolist()
+
+    @grid.setter
+    def grid(self, rows: List[List[bool]]) -> None:
+        """Replace the grid from rows of booleans."""
+        self.cells = np.array(rows, dtype=np.uint8).reshape(self.height, self.width)
+        self._edited()
+
+    def _get_neighbors(self, x: int, y: int) -> int:
+        """Count living neighbors for cell at (x, y) from the boundary's tables."""
+        block = self.cells[np.ix_(self._y_spans[y], self._x_spans[x])]
+        return int(block.sum()) - int(self.cells[y, x])
+
+    def _step(self, n: int) -> None:
+        """Run ``n`` generations with whole-array operations."""
+        start = cells = self.cells
+        columns = np.empty((self.height, self.width + 2), dtype=np.uint8)
+        block = np.empty_like(cells)
+        terms = self.rule.terms
+        mode = PAD_MODES[self.boundary]
+        for _ in range(n):
+            # Sum each 3x3 block including its center, then keep the cells whose
+            # total (and state, where it matters) is one the rule makes live.
+            padded = np.pad(cells, 1, mode=mode)
+            np.add(padded[:-2], padded[1:-1], out=columns)
+            columns += padded[2:]
+            np.add(columns[:, :-2], columns[:, 1:-1], out=block)
+            block += columns[:, 2:]
+            cells = live_cells(block, cells, terms)
+        self.cells = cells
+        self._diff = cells != start
+
+    @property
+    def changed(self) -> Set[Tuple[int, int]]:
+        """Cells flipped by the last :meth:`step`, as (x, y) pairs."""
+        if self._diff is None:
+            return set()
+        return {(int(x), int(y)) for y, x in np.argwhere(self._diff)}
+
+    def _clear(self) -> None:
+        """Replace the storage with empty cells."""
+        self.cells = np.zeros((self.height, self.width), dtype=np.uint8)
+        self._diff = None
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get state of cell at (x, y)."""
+        return bool(self.cells[y, x])
+
+    def set_cell(self, x: int, y: int, alive: bool) -> None:
+        """Set state of cell at (x, y)."""
+        self.cells[y, x] = alive
+        self._edited()
+
+    def get_row_bits(self, y: int) -> int:
+        """Return row y packed into an int, with bit x holding cell (x, y)."""
+        return int.from_bytes(np.packbits(self.cells[y], bitorder="little").tobytes(), "little")
+
+    def set_row_bits(self, y: int, bits: int) -> None:
+        """Replace row y from an int packed like :meth:`get_row_bits`."""
+        nbytes = (self.width + 7) // 8
+        packed = np.frombuffer((bits & ((1 << self.width) - 1)).to_bytes(nbytes, "little"), dtype=np.uint8)
+        self.cells[y] = np.unpackbits(packed, count=self.width, bitorder="little")
+        self._edited()
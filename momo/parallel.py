@@ -0,0 +1,182 @@
+"""Multi-core Game of Life engine stepping strips in shared memory."""
+
+import os
+import weakref
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Set, Tuple
+
+from .bitboard import COLUMN_SHIFTS, next_row, row_cells
+from .core import GameOfLife, axis_neighbors, pack_row, unpack_row
+from .rules import Rule, parse_rule
+
+# Shared memory block attached by each worker process.
+_worker_memory: Optional[SharedMemory] = None
+
+
+def _attach(name: str) -> None:
+    """Pool initializer: attach the grid's shared memory in a worker."""
+    global _worker_memory
+    _worker_memory = SharedMemory(name=name)
+
+
+def _step_strip(task: Tuple[int, int, int, int, int, str, str]) -> None:
+    """
+    Compute rows ``y0..y1`` of the next generation in a worker.
+
+    The strip reads its one-row halos above and below, resolved at the top
+    and bottom edges by the boundary mode, straight from the source plane
+    and writes its rows into the destination plane. The rule travels as its
+    notation and is compiled once per worker, like the neighbor table.
+    """
+    source, y0, y1, width, height, notation, boundary = task
+    rule = parse_rule(notation)
+    shifts = COLUMN_SHIFTS[boundary]
+    neighbors = axis_neighbors(height, boundary)
+    buf = _worker_memory.buf
+    row_bytes = (width + 7) // 8
+    plane = height * row_bytes
+    src = source * plane
+    dst = (1 - source) * plane
+    mask = (1 << width) - 1
+
+    def read(y: int | None) -> int:
+        if y is None:
+            return 0
+        offset = src + y * row_bytes
+        return int.from_bytes(buf[offset:offset + row_bytes], "little")
+
+    above, row = read(neighbors[y0][0]), read(y0)
+    for y in range(y0, y1):
+        below = read(neighbors[y][1])
+        offset = dst + y * row_bytes
+        buf[offset:offset + row_bytes] = next_row(above, row, below, width, mask, rule, shifts).to_bytes(
+            row_bytes, "little")
+        above, row = row, below
+
+
+class ParallelGameOfLife(GameOfLife):
+    """Game of Life stepped by a process pool over shared memory.
+
+    The grid is bit-packed into two planes of a
+    :class:`multiprocessing.shared_memory.SharedMemory` block: the current
+    generation and the one being written. Every generation the rows are cut
+    into horizontal strips, one per worker; each worker reads its one-row
+    halos from the neighboring strips (including the wrap-around edges) in
+    the current plane and writes its strip into the other. Results are
+    identical to the serial engines.
+
+    The pool and shared memory are released by :meth:`close`, on garbage
+    collection, or when used as a context manager.
+    """
+
+    def __init__(self, width: int = 50, height: int = 25, seed: int | None = None,
+                 randomize: bool = False, rule: str | Rule = "B3/S23", boundary: str = "torus",
+                 workers: int | None = None):
+        """
+        Initialize the parallel Game of Life.
+
+        Args:
+            width: Width of the grid
+            height: Height of the grid
+            seed: Random seed for reproducible randomization
+            rule: Rule in B/S notation
+            boundary: Edge handling, one of :data:`~momo.core.BOUNDARIES`
+            workers: Worker processes (default: CPU count)
+        """
+        self.workers = max(1, min(workers or os.cpu_count() or 1, height))
+        self._row_bytes = (width + 7) // 8
+        self._memory = SharedMemory(create=True, size=max(1, 2 * height * self._row_bytes))
+        self._plane = 0
+        self._pool = None
+        self._pools: List[Pool] = []
+        self._finalizer = weakref.finalize(self, ParallelGameOfLife._release, self._memory, self._pools)
+        super().__init__(width, height, seed, randomize, rule, boundary)
+
+    @staticmethod
+    def _release(memory: SharedMemory, pools: List[Pool]) -> None:
+        """Stop the pool and free the shared memory."""
+        for pool in pools:
+            pool.terminate()
+        memory.close()
+        memory.unlink()
+
+    def close(self) -> None:
+        """Stop the worker pool and free the shared memory."""
+        self._finalizer()
+
+    def __enter__(self) -> "ParallelGameOfLife":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _offset(self, y: int) -> int:
+        """Return the byte offset of row y in the current plane."""
+        return (self._plane * self.height + y) * self._row_bytes
+
+    def _step(self, n: int) -> None:
+        """Run ``n`` generations, one pool round per generation."""
+        if self._pool is None:
+            self._pool = Pool(self.workers, initializer=_attach, initargs=(self._memory.name,))
+            self._pools.append(self._pool)
+        start = [self.get_row_bits(y) for y in range(self.height)]
+        bounds = [self.height * i // self.workers for i in range(self.workers + 1)]
+        for _ in range(n):
+            tasks = [(self._plane, bounds[i], bounds[i + 1], self.width, self.height,
+                      self.rule.notation, self.boundary) for i in range(self.workers)]
+            self._pool.map(_step_strip, tasks)
+            self._plane = 1 - self._plane
+        self._diff_rows = [before ^ self.get_row_bits(y) for y, before in enumerate(start)]
+
+    @property
+    def changed(self) -> Set[Tuple[int, int]]:
+        """Cells flipped by the last :meth:`step`, as (x, y) pairs."""
+        return row_cells(self._diff_rows)
+
+    @property
+    def grid(self) -> List[List[bool]]:
+        """Return the grid as rows of booleans."""
+        return [unpack_row(self.get_row_bits(y), self.width) for y in range(self.height)]
+
+    @grid.setter
+    def grid(self, rows: List[List[bool]]) -> None:
+        """Replace the grid from rows of booleans."""
+        for y, row in enumerate(rows):
+            self.set_row_bits(y, pack_row(row))
+
+    def _clear(self) -> None:
+        """Replace the storage with empty cells."""
+        start = self._offset(0)
+        self._memory.buf[start:start + self.height * self._row_bytes] = bytes(self.height * self._row_bytes)
+        self._diff_rows: List[int] = []
+
+    def _get_neighbors(self, x: int, y: int) -> int:
+        """Count living neighbors for cell at (x, y) from the boundary's tables."""
+        xs = self._x_spans[x]
+        return sum(self.get_cell(nx, ny) for ny in self._y_spans[y] for nx in xs) - self.get_cell(x, y)
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get state of cell at (x, y)."""
+        return bool((self._memory.buf[self._offset(y) + x // 8] >> (x % 8)) & 1)
+
+    def set_cell(self, x: int, y: int, alive: bool) -> None:
+        """Set state of cell at (x, y)."""
+        index = self._offset(y) + x // 8
+        if alive:
+            self._memory.buf[index] |= 1 << (x % 8)
+        else:
+            self._memory.buf[index] &= ~(1 << (x % 8)) & 0xFF
+        self._edited()
+
+    def get_row_bits(self, y: int) -> int:
+        """Return row y packed into an int, with bit x holding cell (x, y)."""
+        offset = self._offset(y)
+        return int.from_bytes(self._memory.buf[offset:offset + self._row_bytes], "little")
+
+    def set_row_bits(self, y: int, bits: int) -> None:
+        """Replace row y from an int packed like :meth:`get_row_bits`."""
+        offset = self._offset(y)
+        bits &= (1 << self.width) - 1
+        self._memory.buf[offset:offset + self._row_bytes] = bits.to_bytes(self._row_bytes, "little")
+        self._edited()
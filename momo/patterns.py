@@ -0,0 +1,261 @@
+"""Streaming loaders and savers for RLE and plaintext (.cells) patterns.
+
+Patterns are parsed as a stream of packed rows, ``(y, bits)`` pairs with
+bit x holding cell x, and written to engines through
+:meth:`GameOfLife.set_rows`. Neither the file nor a grid of Python bools is
+ever held in memory, so very large patterns load in bounded memory.
+"""
+
+import re
+from pathlib import Path
+from typing import Iterator, TextIO, Tuple
+
+from .core import GameOfLife
+
+# Size of the chunks an RLE body is read in
+CHUNK_SIZE = 1 << 16
+# Longest line written by save_rle, as recommended by the format
+RLE_LINE_LENGTH = 70
+FORMATS = {".rle": "rle", ".cells": "cells"}
+
+_RLE_HEADER = re.compile(r"\s*x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*(\S+))?", re.I)
+_RLE_TOKEN = re.compile(r"(\d*)([^\d\s])")
+# Maps the characters of a .cells row to binary digits for ``int(..., 2)``
+_CELLS_DIGITS = str.maketrans({"O": "1", ".": "0"})
+
+Rows = Iterator[Tuple[int, int]]
+
+
+def _format(path: Path) -> str:
+    """Return the pattern format named by the file extension."""
+    try:
+        return FORMATS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"unknown pattern format {path.suffix!r} "
+                         f"(expected one of: {', '.join(FORMATS)})") from None
+
+
+def read_rle(stream: TextIO) -> Tuple[int, int, str | None, Rows]:
+    """
+    Parse an RLE pattern from ``stream``.
+
+    The header is read eagerly; the body is parsed lazily in chunks of
+    ``CHUNK_SIZE`` characters while the returned rows are consumed.
+
+    Returns:
+        (width, height, rule, rows), where rule is the notation given in
+        the header or None, and rows yields ``(y, bits)`` for every row
+        with live cells
+    """
+    for line in stream:
+        if line.startswith("#") or not line.strip():
+            continue
+        match = _RLE_HEADER.match(line)
+        if match is None:
+            raise ValueError(f"invalid RLE header: {line.strip()!r}")
+        width, height, rule = int(match.group(1)), int(match.group(2)), match.group(3)
+        break
+    else:
+        raise ValueError("missing RLE header")
+
+    def rows() -> Rows:
+        y = x = bits = 0
+        pending = ""
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            # A run count may be split across chunks
+            text = pending + chunk
+            split = len(text.rstrip("0123456789"))
+            text, pending = text[:split], text[split:]
+            for count, tag in _RLE_TOKEN.findall(text):
+                count = int(count) if count else 1
+                if tag in "b.":
+                    x += count
+                elif tag == "$":
+                    if bits:
+                        yield y, bits
+                    y += count
+                    x = bits = 0
+                elif tag == "!":
+                    if bits:
+                        yield y, bits
+                    return
+                else:
+                    # "o" and any multi-state letter are alive
+                    bits |= ((1 << count) - 1) << x
+                    x += count
+        if bits:
+            yield y, bits
+
+    return width, height, rule, rows()
+
+
+def read_cells(stream: TextIO) -> Tuple[int, int, str | None, Rows]:
+    """
+    Parse a plaintext ``.cells`` pattern from a seekable ``stream``.
+
+    The size is not stored in the format, so the stream is scanned once
+    for it and then rewound; rows are parsed lazily.
+
+    Returns:
+        (width, height, None, rows) like :func:`read_rle`; the format
+        records no rule
+    """
+    start = stream.tell()
+    width = height = 0
+    for line in stream:
+        if line.startswith("!"):
+            continue
+        width = max(width, len(line.rstrip()))
+        height += 1
+    stream.seek(start)
+
+    def rows() -> Rows:
+        y = 0
+        for line in stream:
+            if line.startswith("!"):
+                continue
+            line = line.rstrip()
+            if "O" in line:
+                yield y, int(line[::-1].translate(_CELLS_DIGITS), 2)
+            y += 1
+
+    return width, height, None, rows()
+
+
+def _header(path: str | Path) -> Tuple[int, int, str | None]:
+    """Return the (width, height, rule) of the pattern stored at ``path``."""
+    path = Path(path)
+    reader = read_rle if _format(path) == "rle" else read_cells
+    with open(path, encoding="utf-8") as stream:
+        width, height, rule, _ = reader(stream)
+    return width, height, rule
+
+
+def pattern_size(path: str | Path) -> Tuple[int, int]:
+    """Return the (width, height) of the pattern stored at ``path``."""
+    width, height, _ = _header(path)
+    return width, height
+
+
+def pattern_rule(path: str | Path) -> str | None:
+    """Return the rule named by the pattern at ``path``, or None if it names none."""
+    return _header(path)[2]
+
+
+def load_pattern(path: str | Path, game: GameOfLife, x: int | None = None,
+                 y: int | None = None) -> Tuple[int, int]:
+    """
+    Clear ``game`` and place the pattern stored at ``path`` in it.
+
+    The format is chosen by the file extension (``.rle`` or ``.cells``).
+    The pattern wraps around the edges of toroidal engines.
+
+    Args:
+        path: Pattern file
+        game: Engine to load into
+        x: Column of the pattern's left edge (default: centered)
+        y: Row of the pattern's top edge (default: centered)
+
+    Returns:
+        The pattern's (width, height)
+
+    Raises:
+        ValueError: If the format is unknown or the pattern does not fit
+    """
+    path = Path(path)
+    reader = read_rle if _format(path) == "rle" else read_cells
+    with open(path, encoding="utf-8") as stream:
+        width, height, _, rows = reader(stream)
+        if width > game.width or height > game.height:
+            raise ValueError(f"pattern is {width}x{height}, larger than the "
+                             f"{game.width}x{game.height} grid")
+        x = (game.width - width) // 2 if x is None else x % game.width
+        y = (game.height - height) // 2 if y is None else y % game.height
+        mask = (1 << game.width) - 1
+        shift = game.width - x
+
+        def placed() -> Rows:
+            for row, bits in rows:
+                yield (y + row) % game.height, ((bits << x) | (bits >> shift)) & mask
+
+        game.clear()
+        game.set_rows(placed())
+    return width, height
+
+
+def _runs(bits: int) -> Iterator[Tuple[int, int]]:
+    """Yield (dead, alive) run lengths of a packed row, without trailing dead cells."""
+    while bits:
+        dead = (bits & -bits).bit_length() - 1
+        bits >>= dead
+        alive = ((bits ^ (bits + 1)) >> 1).bit_length()
+        bits >>= alive
+        yield dead, alive
+
+
+def save_rle(game: GameOfLife, path: str | Path, rule: str | None = None) -> None:
+    """
+    Write the grid of ``game`` to ``path`` as RLE, one row at a time.
+
+    Args:
+        game: Engine to save
+        path: Destination file
+        rule: Rule recorded in the header (default: the game's rule)
+    """
+    rule = rule or game.rule.notation
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.write(f"x = {game.width}, y = {game.height}, rule = {rule}\n")
+        line = ""
+        last = 0
+
+        def emit(token: str) -> None:
+            nonlocal line
+            if len(line) + len(token) > RLE_LINE_LENGTH:
+                stream.write(line + "\n")
+                line = ""
+            line += token
+
+        for y in range(game.height):
+            bits = game.get_row_bits(y)
+            if not bits:
+                continue
+            if y > last:
+                # End the previous row and skip blank ones in a single token
+                emit(f"{y - last}$" if y - last > 1 else "$")
+            last = y
+            for dead, alive in _runs(bits):
+                if dead:
+                    emit(f"{dead}b" if dead > 1 else "b")
+                emit(f"{alive}o" if alive > 1 else "o")
+        emit("!")
+        stream.write(line + "\n")
+
+
+def save_cells(game: GameOfLife, path: str | Path, name: str | None = None) -> None:
+    """
+    Write the grid of ``game`` to ``path`` as plaintext, one row at a time.
+
+    Args:
+        game: Engine to save
+        path: Destination file
+        name: Pattern name recorded in a ``!Name:`` comment
+    """
+    with open(path, "w", encoding="utf-8") as stream:
+        if name:
+            stream.write(f"!Name: {name}\n")
+        for y in range(game.height):
+            bits = game.get_row_bits(y)
+            stream.write(format(bits, "b")[::-1].replace("1", "O").replace("0", ".") if bits else "")
+            stream.write("\n")
+
+
+def save_pattern(game: GameOfLife, path: str | Path) -> None:
+    """Save ``game`` to ``path`` in the format named by its extension."""
+    path = Path(path)
+    if _format(path) == "rle":
+        save_rle(game, path)
+    else:
+        save_cells(game, path)
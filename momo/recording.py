@@ -0,0 +1,290 @@
+"""Delta-encoded recordings of runs and their seekable replay.
+
+A recording is a header followed by records appended as the run goes::
+
+    header   "<8sII": magic, width, height
+    record   "<BQI": kind, generation, payload length, then the payload
+
+A ``KEYFRAME`` payload is the zlib-compressed grid as bit-packed rows
+(``ceil(width / 8)`` little-endian bytes each). A ``DELTA`` payload lists
+the cells flipped since the previous record as varint-encoded gaps between
+their sorted indices ``y * width + x``. A keyframe is written every
+``keyframe_interval`` generations, so seeking costs one keyframe plus at
+most that many deltas and never re-simulates.
+"""
+
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Tuple
+
+from .bitboard import BitboardGameOfLife
+from .core import GameOfLife
+
+MAGIC = b"MOMOREC1"
+KEYFRAME, DELTA = 0, 1
+_HEADER = struct.Struct("<8sII")
+_RECORD = struct.Struct("<BQI")
+
+
+def _encode_flips(before: List[int], after: List[int], width: int) -> bytes:
+    """Return the varint gaps between the indices of the cells that differ."""
+    out = bytearray()
+    previous = 0
+    for y, (old, new) in enumerate(zip(before, after)):
+        flips = old ^ new
+        base = y * width
+        while flips:
+            low = flips & -flips
+            index = base + low.bit_length() - 1
+            gap = index - previous
+            previous = index
+            while gap >= 0x80:
+                out.append(gap & 0x7F | 0x80)
+                gap >>= 7
+            out.append(gap)
+            flips ^= low
+    return bytes(out)
+
+
+def _decode_flips(payload: bytes) -> Iterator[int]:
+    """Yield the cell indices encoded by :func:`_encode_flips`."""
+    index = gap = shift = 0
+    for byte in payload:
+        gap |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        index += gap
+        yield index
+        gap = shift = 0
+
+
+class Recorder:
+    """Appends the evolution of a game to a recording file.
+
+    The recorder keeps its own generation counter, advanced by the count
+    passed to :meth:`record`, so clearing or reseeding the game mid-run does
+    not move the timeline backwards. Cells edited between records are part
+    of the next delta.
+    """
+
+    def __init__(self, path: str | Path, game: GameOfLife, keyframe_interval: int = 1000):
+        """
+        Start a recording with a keyframe of the game's current grid.
+
+        Args:
+            path: Destination file, truncated if it exists
+            game: Game to record
+            keyframe_interval: Generations between full keyframes
+        """
+        if keyframe_interval <= 0:
+            raise ValueError("keyframe_interval must be positive")
+        self.game = game
+        self.keyframe_interval = keyframe_interval
+        self.generation = 0
+        self._row_bytes = (game.width + 7) // 8
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, game.width, game.height))
+        self._rows = self._snapshot()
+        self._write_keyframe()
+
+    def _snapshot(self) -> List[int]:
+        return [self.game.get_row_bits(y) for y in range(self.game.height)]
+
+    def _write(self, kind: int, payload: bytes) -> None:
+        self._file.write(_RECORD.pack(kind, self.generation, len(payload)))
+        self._file.write(payload)
+
+    def _write_keyframe(self) -> None:
+        body = b"".join(bits.to_bytes(self._row_bytes, "little") for bits in self._rows)
+        self._write(KEYFRAME, zlib.compress(body, 1))
+        self._last_keyframe = self.generation
+        # Keyframes are the resume points of a recording, so persist them
+        self._file.flush()
+
+    def record(self, generations: int = 1) -> None:
+        """
+        Record the game's grid after it advanced ``generations``.
+
+        Args:
+            generations: Generations since the previous record
+        """
+        if generations <= 0:
+            raise ValueError("generations must be positive")
+        rows = self._snapshot()
+        previous, self._rows = self._rows, rows
+        self.generation += generations
+        if self.generation - self._last_keyframe >= self.keyframe_interval:
+            self._write_keyframe()
+        else:
+            self._write(DELTA, _encode_flips(previous, rows, self.game.width))
+
+    def close(self) -> None:
+        """Flush and close the recording file."""
+        self._file.close()
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class Replay(BitboardGameOfLife):
+    """Plays a recording back as a read-only game.
+
+    :meth:`step` moves forward through the recorded generations and
+    :meth:`seek` jumps to any generation by loading the nearest keyframe at
+    or before it and applying the deltas after it. Reaching a generation
+    between two records shows the earlier one; stepping stops at the last
+    recorded generation. Opening a recording scans its record headers once
+    to index the keyframes. Editing the shown grid raises TypeError, since
+    the edits would not be part of the recording.
+    """
+
+    # Set once the first frame is shown; before that, construction may edit
+    _opened = False
+
+    def __init__(self, path: str | Path):
+        """
+        Open a recording.
+
+        Args:
+            path: Recording written by :class:`Recorder`
+
+        Raises:
+            ValueError: If the file is not a recording
+        """
+        self._file: BinaryIO = open(path, "rb")
+        header = self._file.read(_HEADER.size)
+        if len(header) < _HEADER.size or not header.startswith(MAGIC):
+            self._file.close()
+            raise ValueError(f"{path} is not a momo recording")
+        _, width, height = _HEADER.unpack(header)
+        size = os.fstat(self._file.fileno()).st_size
+        # (generation, file offset) of every keyframe, and the last generation
+        self._keyframes: List[Tuple[int, int]] = []
+        self.last_generation = 0
+        offset = _HEADER.size
+        while True:
+            header = self._file.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                break
+            kind, generation, length = _RECORD.unpack(header)
+            # Ignore a record cut short by an interrupted recording
+            if offset + _RECORD.size + length > size:
+                break
+            self._file.seek(length, os.SEEK_CUR)
+            if kind == KEYFRAME:
+                self._keyframes.append((generation, offset))
+            self.last_generation = generation
+            offset += _RECORD.size + length
+        self._end = offset
+        if not self._keyframes:
+            self._file.close()
+            raise ValueError(f"{path} has no keyframe")
+        # Offset of the record after the one currently shown
+        self._next = None
+        super().__init__(width, height)
+        self.seek(0)
+        self._opened = True
+
+    def _read_only(self) -> None:
+        if self._opened:
+            raise TypeError("a replay is read-only")
+
+    @BitboardGameOfLife.grid.setter
+    def grid(self, rows) -> None:
+        """Refuse to replace the grid of a replay."""
+        self._read_only()
+        BitboardGameOfLife.grid.fset(self, rows)
+
+    def clear(self) -> None:
+        """Refuse to clear a replay."""
+        self._read_only()
+        super().clear()
+
+    def randomize(self, seed: int | None = None) -> None:
+        """Refuse to randomize a replay."""
+        self._read_only()
+        super().randomize(seed)
+
+    def set_cell(self, x: int, y: int, alive: bool) -> None:
+        """Refuse to edit a cell of a replay."""
+        self._read_only()
+        super().set_cell(x, y, alive)
+
+    def set_row_bits(self, y: int, bits: int) -> None:
+        """Refuse to edit a row of a replay."""
+        self._read_only()
+        super().set_row_bits(y, bits)
+
+    def close(self) -> None:
+        """Close the recording file."""
+        self._file.close()
+
+    def __enter__(self) -> "Replay":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _records(self, offset: int) -> Iterator[Tuple[int, int, bytes, int]]:
+        """Yield (kind, generation, payload, next offset) from ``offset`` on."""
+        self._file.seek(offset)
+        while offset < self._end:
+            kind, generation, length = _RECORD.unpack(self._file.read(_RECORD.size))
+            payload = self._file.read(length)
+            offset += _RECORD.size + length
+            yield kind, generation, payload, offset
+
+    def _apply(self, kind: int, payload: bytes) -> None:
+        """Apply one record to the shown rows."""
+        if kind == KEYFRAME:
+            body = zlib.decompress(payload)
+            size = (self.width + 7) // 8
+            self.rows = [int.from_bytes(body[i:i + size], "little") for i in range(0, len(body), size)]
+        else:
+            rows, width = self.rows, self.width
+            for index in _decode_flips(payload):
+                y, x = divmod(index, width)
+                rows[y] ^= 1 << x
+
+    def seek(self, generation: int) -> None:
+        """
+        Show the grid recorded at ``generation``, without re-simulating.
+
+        Args:
+            generation: Target generation, clamped to the recorded range
+        """
+        generation = max(0, min(generation, self.last_generation))
+        # Deltas flip rows in place, so compare against a copy
+        start = list(self.rows)
+        key = bisect_right(self._keyframes, (generation, float("inf"))) - 1
+        key_generation, offset = self._keyframes[key]
+        if self._next is not None and key_generation <= self._shown <= generation:
+            # Continue forward from the record on screen
+            offset = self._next
+        else:
+            self._shown = -1
+        for kind, recorded, payload, following in self._records(offset):
+            if recorded > generation:
+                break
+            self._apply(kind, payload)
+            self._shown, self._next = recorded, following
+        self.generation = generation
+        self._diff_rows = [before ^ after for before, after in zip(start, self.rows)]
+        self._edited()
+
+    def step(self, n: int = 1) -> None:
+        """Move ``n`` generations forward through the recording."""
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        self.seek(self.generation + n)
+
+    def _step(self, n: int) -> None:
+        """Recordings are replayed, not simulated."""
+        self.seek(self.generation + n)
@@ -0,0 +1,148 @@
+"""Life-like rules in B/S notation, compiled to lookup tables.
+
+A rule such as ``B36/S23`` lists the neighbor counts at which a dead cell
+is born and a live cell survives; every other cell is dead in the next
+generation. Engines never branch on the rule per cell: they index
+:attr:`Rule.table` with the neighbor count and the cell's state, compare
+whole arrays against the few block totals in :attr:`Rule.terms`, or call
+:attr:`Rule.kernel` on the bit planes of the block totals of a packed row.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Tuple
+
+_BS = re.compile(r"B([0-8]*)/S([0-8]*)", re.I)
+_SB = re.compile(r"S([0-8]*)/B([0-8]*)", re.I)
+_LEGACY = re.compile(r"([0-8]*)/([0-8]*)")
+
+# (b0, b1, b2, b3, row) -> packed next row, before masking to the width
+Kernel = Callable[[int, int, int, int, int], int]
+# (block total, required center state or None for either) pairs that live
+BlockTerms = Tuple[Tuple[int, bool | None], ...]
+
+
+def _block_terms(table: bytes) -> BlockTerms:
+    """Return the block totals at which a cell lives, as :data:`BlockTerms`."""
+    terms = []
+    for total in range(10):
+        # Block total t means t neighbors for a dead cell, t - 1 for a live one
+        born = total <= 8 and bool(table[total])
+        survives = total >= 1 and bool(table[9 + total - 1])
+        if born or survives:
+            terms.append((total, None if born and survives else survives))
+    return tuple(terms)
+
+
+def _compile_kernel(terms: BlockTerms) -> Kernel:
+    """
+    Build the bit-sliced next-row function of a rule.
+
+    The 3x3 block total of every cell (0..9, center included) arrives as
+    four bit planes. Each live term becomes one AND of the planes or their
+    complements, restricted to dead or live centers when needed, and the
+    terms are OR-ed together. The expression is generated once per rule, so
+    stepping runs straight-line big-int operations with no loop over the
+    rule.
+    """
+    clauses = []
+    for total, center in terms:
+        factors = [f"b{plane}" if total >> plane & 1 else f"~b{plane}" for plane in range(4)]
+        if center is not None:
+            factors.append("row" if center else "~row")
+        clauses.append("(" + " & ".join(factors) + ")")
+    source = f"def kernel(b0, b1, b2, b3, row):\n    return {' | '.join(clauses) or '0'}\n"
+    namespace: Dict[str, Kernel] = {}
+    exec(source, namespace)
+    return namespace["kernel"]
+
+
+class Rule:
+    """A Life-like rule: the neighbor counts of birth and of survival.
+
+    :attr:`table` holds the next state of a cell at index
+    ``9 * alive + neighbors``, which is also ``8 * alive + block`` for the
+    3x3 block total including the cell. :attr:`terms` lists the block
+    totals that produce a live cell as ``(total, center)`` pairs, where
+    ``center`` is the required state of the cell or None for either; array
+    engines compare against those few totals instead of indexing a table.
+    :attr:`kernel` computes a packed row from the bit planes of its block
+    totals (see :func:`momo.bitboard.next_row`).
+
+    Rules compare and hash by their canonical notation, e.g. ``B3/S23``.
+    """
+
+    def __init__(self, birth: FrozenSet[int], survival: FrozenSet[int]):
+        """
+        Initialize a rule from its neighbor counts.
+
+        Args:
+            birth: Neighbor counts at which a dead cell becomes alive
+            survival: Neighbor counts at which a live cell stays alive
+        """
+        if not birth <= set(range(9)) or not survival <= set(range(9)):
+            raise ValueError("neighbor counts must be between 0 and 8")
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
+        self.table = bytes([n in self.birth for n in range(9)] + [n in self.survival for n in range(9)])
+        self.terms = _block_terms(self.table)
+        self.kernel = _compile_kernel(self.terms)
+
+    @property
+    def notation(self) -> str:
+        """Canonical B/S notation of the rule."""
+        return "B{}/S{}".format("".join(map(str, sorted(self.birth))),
+                                "".join(map(str, sorted(self.survival))))
+
+    def __str__(self) -> str:
+        return self.notation
+
+    def __repr__(self) -> str:
+        return f"Rule({self.notation!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Rule) and (self.birth, self.survival) == (other.birth, other.survival)
+
+    def __hash__(self) -> int:
+        return hash((self.birth, self.survival))
+
+    def __reduce__(self):
+        # The compiled kernel cannot be pickled; rebuild it from the notation
+        return parse_rule, (self.notation,)
+
+
+@lru_cache(maxsize=None)
+def _parse(text: str) -> Rule:
+    text = text.strip()
+    match = _BS.fullmatch(text)
+    if match:
+        birth, survival = match.groups()
+    else:
+        match = _SB.fullmatch(text) or _LEGACY.fullmatch(text)
+        if not match:
+            raise ValueError(f"invalid rule {text!r} (expected B/S notation such as B3/S23)")
+        # S/B order, as in the legacy "23/3" form
+        survival, birth = match.groups()
+    return Rule(frozenset(map(int, birth)), frozenset(map(int, survival)))
+
+
+def parse_rule(rule: str | Rule) -> Rule:
+    """
+    Return the rule for ``B3/S23``-style notation.
+
+    ``S23/B3`` and the legacy survival-first ``23/3`` are accepted too, in
+    any letter case. Parsed rules are cached, so engines can share them.
+
+    Args:
+        rule: Rule notation, or an existing :class:`Rule` (returned as is)
+
+    Raises:
+        ValueError: If the notation is malformed
+    """
+    if isinstance(rule, Rule):
+        return rule
+    return _parse(rule)
+
+
+# Conway's Game of Life
+LIFE = parse_rule("B3/S23")
@@ -0,0 +1,97 @@
+"""Fixed-timestep pacing of simulation ticks and rendered frames."""
+
+import time
+from typing import Callable
+
+
+class Scheduler:
+    """Decouples the simulation rate from the render rate.
+
+    Generations are due on a fixed timestep of ``1 / gps`` seconds and
+    frames on one of ``1 / fps`` seconds, both measured against absolute
+    deadlines so step and render cost do not make the rates drift. When the
+    simulation falls behind, the due generations are returned as one batch
+    (at most ``max_batch``; older backlog is dropped). When rendering falls
+    behind, missed frames are dropped rather than drawn back to back.
+
+    A ``gps`` of ``None`` or 0 means unlimited: one generation is due on
+    every call, so throughput is bounded by compute alone.
+    """
+
+    def __init__(self, gps: float | None, fps: float, max_batch: int = 1000,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the scheduler.
+
+        Args:
+            gps: Target generations per second, or None for unlimited
+            fps: Target frames per second
+            max_batch: Most generations returned by one due_generations call
+            clock: Monotonic time source in seconds
+        """
+        if gps is not None and gps < 0:
+            raise ValueError("gps must be non-negative")
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.tick_interval = 1 / gps if gps else 0.0
+        self.frame_interval = 1 / fps
+        self.max_batch = max_batch
+        self.clock = clock
+        self.dropped_frames = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart both deadlines from now, e.g. after resuming from pause."""
+        now = self.clock()
+        self.next_tick = now + self.tick_interval
+        self.next_frame = now
+
+    def due_generations(self) -> int:
+        """Return how many generations are due now and advance the deadline."""
+        if not self.tick_interval:
+            return 1
+        now = self.clock()
+        if now < self.next_tick:
+            return 0
+        due = int((now - self.next_tick) / self.tick_interval) + 1
+        if due > self.max_batch:
+            # Too far behind to catch up: drop the backlog
+            due = self.max_batch
+            self.next_tick = now + self.tick_interval
+        else:
+            self.next_tick += due * self.tick_interval
+        return due
+
+    def frame_due(self) -> bool:
+        """Return whether a frame should be rendered now and advance the deadline."""
+        now = self.clock()
+        if now < self.next_frame:
+            return False
+        self.next_frame += self.frame_interval
+        if self.next_frame <= now:
+            # Rendering fell behind: skip the frames we missed
+            missed = int((now - self.next_frame) / self.frame_interval) + 1
+            self.dropped_frames += missed
+            self.next_frame += missed * self.frame_interval
+        return True
+
+    def until_tick(self) -> float:
+        """Return the seconds left until the next generation is due."""
+        if not self.tick_interval:
+            return 0.0
+        return max(0.0, self.next_tick - self.clock())
+
+    def until_frame(self) -> float:
+        """Return the seconds left until the next frame is due."""
+        return max(0.0, self.next_frame - self.clock())
+
+    def sleep_time(self, paused: bool = False) -> float:
+        """
+        Return how long to sleep until the next deadline.
+
+        Args:
+            paused: Whether the simulation is paused, so only frames are due
+        """
+        if paused:
+            return self.until_frame()
+        return min(self.until_tick(), self.until_frame())
@@ -0,0 +1,178 @@
+"""Sparse Game of Life engine storing only live cells."""
+
+from collections import Counter
+from typing import Iterable, List, Set, Tuple
+
+from .core import GameOfLife, zobrist_key
+from .rules import Rule, parse_rule
+
+_OFFSETS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+
+
+class SparseGameOfLife(GameOfLife):
+    """Game of Life over a set of live coordinates.
+
+    Each generation only counts neighbors around live cells, so its cost is
+    proportional to the population rather than to ``width * height``.
+
+    With ``wrap=True`` (the default) the universe is the same torus as
+    :class:`GameOfLife`. With ``wrap=False`` it is an unbounded plane: cells
+    may live at any integer coordinates, and ``width``/``height`` only size
+    the window exposed through ``grid``.
+    """
+
+    def __init__(self, width: int = 50, height: int = 25, seed: int | None = None,
+                 randomize: bool = False, rule: str | Rule = "B3/S23", boundary: str = "torus",
+                 wrap: bool = True):
+        """
+        Initialize the sparse Game of Life.
+
+        Args:
+            width: Width of the grid (of the visible window when not wrapping)
+            height: Height of the grid (of the visible window when not wrapping)
+            seed: Random seed for reproducible randomization
+            rule: Rule in B/S notation; it may not give birth with 0 neighbors
+            boundary: Only ``"torus"``; use ``wrap`` to choose between the
+                torus and the unbounded plane
+            wrap: Use toroidal boundaries instead of an unbounded plane
+
+        Raises:
+            ValueError: If the rule is malformed or contains B0, or the
+                boundary is not ``"torus"``
+        """
+        if 0 in parse_rule(rule).birth:
+            raise ValueError("the sparse engine only visits cells near live ones and cannot play B0 rules")
+        if boundary != "torus":
+            raise ValueError("the sparse engine only supports the torus boundary (or wrap=False)")
+        self.wrap = wrap
+        super().__init__(width, height, seed, randomize, rule, boundary)
+
+    @property
+    def grid(self) -> List[List[bool]]:
+        """Return the ``width x height`` window at the origin as rows of booleans."""
+        rows = [[False] * self.width for _ in range(self.height)]
+        for x, y in self.live:
+            if 0 <= x < self.width and 0 <= y < self.height:
+                rows[y][x] = True
+        return rows
+
+    @grid.setter
+    def grid(self, rows: List[List[bool]]) -> None:
+        """Replace all live cells with those set in ``rows``."""
+        self.live = {(x, y) for y, row in enumerate(rows) for x, alive in enumerate(row) if alive}
+        self._edited()
+
+    def _wrap(self, x: int, y: int) -> Tuple[int, int]:
+        """Map (x, y) onto the torus, or leave it alone on the plane."""
+        if self.wrap:
+            return x % self.width, y % self.height
+        return x, y
+
+    def _get_neighbors(self, x: int, y: int) -> int:
+        """Count living neighbors for cell at (x, y)."""
+        return sum(self._wrap(x + dx, y + dy) in self.live for dx, dy in _OFFSETS)
+
+    def _step(self, n: int) -> None:
+        """Run ``n`` generations over the live set."""
+        start = live = self.live
+        width, height = self.width, self.height
+        # Next state indexed by 9 * alive + neighbors
+        table = self.rule.table
+        for _ in range(n):
+            if self.wrap:
+                counts = Counter(((x + dx) % width, (y + dy) % height)
+                                 for x, y in live for dx, dy in _OFFSETS)
+            else:
+                counts = Counter((x + dx, y + dy) for x, y in live for dx, dy in _OFFSETS)
+            after = {cell for cell, count in counts.items() if table[9 * (cell in live) + count]}
+            if table[9]:
+                # Isolated live cells have no count but survive under S0
+                after.update(cell for cell in live if cell not in counts)
+            live = after
+        self.live = live
+        self.changed = start ^ live
+
+    def _clear(self) -> None:
+        """Replace the storage with empty cells."""
+        self.live: Set[Tuple[int, int]] = set()
+        self.changed: Set[Tuple[int, int]] = set()
+
+    def _cell_key(self, x: int, y: int) -> int:
+        """Return the Zobrist key of (x, y), for any coordinates on the plane."""
+        if self.wrap:
+            return zobrist_key(y * self.width + x)
+        # Zigzag both coordinates to naturals, then pair them (Szudzik) so
+        # that cells outside the window never share a key
+        x = 2 * x if x >= 0 else -2 * x - 1
+        y = 2 * y if y >= 0 else -2 * y - 1
+        return zobrist_key(x * x + x + y if x >= y else y * y + x)
+
+    def state_hash(self) -> int:
+        """Return the Zobrist hash of every live cell, inside the window or not."""
+        if self._hash is None:
+            value = 0
+            key = self._cell_key
+            for x, y in self.live:
+                value ^= key(x, y)
+            self._hash = value
+        return self._hash
+
+    def population(self) -> int:
+        """Return the number of live cells, inside the window or not."""
+        return len(self.live)
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get state of cell at (x, y)."""
+        return self._wrap(x, y) in self.live
+
+    def set_cell(self, x: int, y: int, alive: bool) -> None:
+        """Set state of cell at (x, y)."""
+        if alive:
+            self.live.add(self._wrap(x, y))
+        else:
+            self.live.discard(self._wrap(x, y))
+        self._edited()
+
+    def get_row_bits(self, y: int) -> int:
+        """Return row y of the window packed into an int, with bit x holding cell (x, y)."""
+        bits = 0
+        for cx, cy in self.live:
+            if cy == y and 0 <= cx < self.width:
+                bits |= 1 << cx
+        return bits
+
+    def set_row_bits(self, y: int, bits: int) -> None:
+        """Replace row y of the window from an int packed like :meth:`get_row_bits`."""
+        self.live = {(cx, cy) for cx, cy in self.live if cy != y or not 0 <= cx < self.width}
+        self.live.update((x, y) for x in range(self.width) if (bits >> x) & 1)
+        self._edited()
+
+    def set_rows(self, rows: Iterable[Tuple[int, int]]) -> None:
+        """Replace several rows of the window, filtering the live set only once."""
+        rows = dict(rows)
+        self.live = {(cx, cy) for cx, cy in self.live if cy not in rows or not 0 <= cx < self.width}
+        for y, bits in rows.items():
+            bits &= (1 << self.width) - 1
+            while bits:
+                low = bits & -bits
+                self.live.add((low.bit_length() - 1, y))
+                bits ^= low
+        self._edited()
+
+    def get_region_bits(self, x: int, y: int, width: int, height: int) -> List[int]:
+        """
+        Return a ``width x height`` window of the world as packed rows.
+
+        Only live cells are visited, so the cost follows the population.
+        """
+        if self.wrap and (width > self.width or height > self.height):
+            return super().get_region_bits(x, y, width, height)
+        rows = [0] * height
+        for cx, cy in self.live:
+            if self.wrap:
+                rx, ry = (cx - x) % self.width, (cy - y) % self.height
+            else:
+                rx, ry = cx - x, cy - y
+            if 0 <= rx < width and 0 <= ry < height:
+                rows[ry] |= 1 << rx
+        return rows
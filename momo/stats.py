@@ -0,0 +1,132 @@
+"""Rolling timings of the simulation's phases and their export."""
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Sequence, TextIO
+
+# Phases timed by the terminal front end, in status-line order
+PHASES = ("step", "render", "input", "sleep")
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Return the ``pct`` percentile of ``samples`` by the nearest-rank method.
+
+    Args:
+        samples: Measurements, in any order
+        pct: Percentile between 0 and 100
+    """
+    if not samples:
+        raise ValueError("samples must not be empty")
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class PhaseStats:
+    """Durations of the most recent calls of each phase.
+
+    Each phase keeps the last ``window`` durations in seconds, so averages
+    and percentiles follow the current behaviour rather than the whole run.
+    """
+
+    def __init__(self, window: int = 120, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the statistics.
+
+        Args:
+            window: Durations kept per phase
+            clock: Time source in seconds
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.clock = clock
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Add one duration of ``phase``."""
+        samples = self._samples.get(phase)
+        if samples is None:
+            samples = self._samples[phase] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """Record the duration of the ``with`` block as one call of ``phase``."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(phase, self.clock() - start)
+
+    def mean(self, phase: str) -> float:
+        """Return the average duration of ``phase``, or 0 if it never ran."""
+        samples = self._samples.get(phase)
+        return sum(samples) / len(samples) if samples else 0.0
+
+    def percentile(self, phase: str, pct: float) -> float:
+        """Return the ``pct`` percentile duration of ``phase``, or 0 if it never ran."""
+        samples = self._samples.get(phase)
+        return percentile(samples, pct) if samples else 0.0
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return count, mean and p50/p90/p99 in seconds for every phase that ran."""
+        return {
+            phase: {
+                "count": len(samples),
+                "mean": self.mean(phase),
+                "p50": percentile(samples, 50),
+                "p90": percentile(samples, 90),
+                "p99": percentile(samples, 99),
+            }
+            for phase, samples in self._samples.items() if samples
+        }
+
+    def status(self) -> str:
+        """Return the average of each phase in milliseconds for the status line."""
+        return " ".join(f"{phase} {self.mean(phase) * 1000:.1f}ms"
+                        for phase in PHASES if phase in self._samples)
+
+
+class MetricsWriter:
+    """Appends phase statistics to a stream as newline-delimited JSON.
+
+    At most one record is written every ``interval`` seconds. Each record
+    holds the wall-clock time, the generation, the number of dropped frames
+    and :meth:`PhaseStats.summary`.
+    """
+
+    def __init__(self, stream: TextIO, interval: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Text stream receiving one JSON object per line
+            interval: Minimum seconds between records
+            clock: Monotonic time source in seconds
+        """
+        self.stream = stream
+        self.interval = interval
+        self.clock = clock
+        self._next = clock()
+
+    def write(self, stats: PhaseStats, generation: int, dropped_frames: int = 0) -> None:
+        """Write one record now."""
+        record = {
+            "time": time.time(),
+            "generation": generation,
+            "dropped_frames": dropped_frames,
+            "phases": stats.summary(),
+        }
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+        self._next = self.clock() + self.interval
+
+    def maybe_write(self, stats: PhaseStats, generation: int, dropped_frames: int = 0) -> None:
+        """Write a record if ``interval`` has passed since the last one."""
+        if self.clock() >= self._next:
+            self.write(stats, generation, dropped_frames)
@@ -7,20 +7,50 @@ width: int
 height: int
     Height of the display area (in cells).
 speed: int | None
-    Milliseconds per generation. ``None`` disables automatic stepping.
+    Milliseconds per generation; 0 runs as fast as the engine allows.
 seed: int | None
     Seed for deterministic randomization.
+engine: str
+    Name of the stepping engine (see :mod:`momo.engines`).
+mode: str
+    Display mode: ``"cell"``, ``"halfblock"`` or ``"braille"``.
+view_width: int | None
+    Width of the visible window (in cells). Defaults to ``width``.
+view_height: int | None
+    Height of the visible window (in cells). Defaults to ``height``.
+fps: float
+    Target frames per second, independent of the simulation rate.
+metrics: TextIO | None
+    Stream receiving phase timings as newline-delimited JSON.
+on_cycle: str | None
+    What to do when the grid settles into a still life or oscillator:
+    ``"pause"``, ``"reseed"`` or ``"stop"``. None keeps running.
+checkpoint: str
+    File written by the save key and read by the load key.
+rule: str
+    Life-like rule in B/S notation, e.g. ``"B36/S23"``.
+boundary: str
+    Edge handling: ``"torus"``, ``"dead"`` or ``"mirror"``.
 """
 
 import argparse
-import select
+import asyncio
+import os
 import sys
 import termios
 import time
 import tty
+from typing import List, TextIO
 
-from .core import GameOfLife
-from .display import Display
+from .display import MODES, Display
+from .checkpoint import load_checkpoint, save_checkpoint
+from .core import BOUNDARIES, GameOfLife
+from .engines import ENGINES, create_game
+from .patterns import load_pattern, pattern_rule, pattern_size
+from .recording import Recorder, Replay
+from .scheduler import Scheduler
+from .stats import MetricsWriter, PhaseStats
+from .viewport import Viewport
 
 
 class TerminalInterface:
@@ -33,76 +63,357 @@ class TerminalInterface:
     height: int
         Height of the display area (in cells).
     speed: int | None
-        Milliseconds per generation. ``None`` disables automatic stepping.
+        Milliseconds per generation; 0 runs as fast as the engine allows.
     seed: int | None
         Seed for deterministic randomization.
+    engine: str
+        Name of the stepping engine (see :mod:`momo.engines`).
+    mode: str
+        Display mode: ``"cell"``, ``"halfblock"`` or ``"braille"``.
+    view_width: int | None
+        Width of the visible window (in cells). Defaults to ``width``.
+    view_height: int | None
+        Height of the visible window (in cells). Defaults to ``height``.
+    fps: float
+        Target frames per second, independent of the simulation rate.
+    metrics: TextIO | None
+        Stream receiving phase timings as newline-delimited JSON.
+    on_cycle: str | None
+        What to do when the grid settles into a still life or oscillator:
+        ``"pause"``, ``"reseed"`` or ``"stop"``. None keeps running.
+    checkpoint: str
+        File written by the save key and read by the load key.
+    rule: str
+        Life-like rule in B/S notation; a loaded checkpoint brings its own.
+    boundary: str
+        Edge handling, one of :data:`momo.core.BOUNDARIES`; a loaded
+        checkpoint brings its own.
     """
 
-    def __init__(self, width: int, height: int, speed: int | None = None, seed: int | None = None):
+    CYCLE_ACTIONS = ("pause", "reseed", "stop")
+    # Generations skipped by the replay seek keys
+    SEEK_STEP = 100
+
+    def __init__(self, width: int, height: int, speed: int | None = None, seed: int | None = None,
+                 engine: str = "list", mode: str = "cell", view_width: int | None = None,
+                 view_height: int | None = None, fps: float = 30, metrics: TextIO | None = None,
+                 on_cycle: str | None = None, checkpoint: str = "momo.ckpt", rule: str = "B3/S23",
+                 boundary: str = "torus"):
         if width <= 0 or height <= 0:
             raise ValueError("width and height must be positive")
         if speed is not None and speed < 0:
             raise ValueError("speed must be non-negative")
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        if on_cycle is not None and on_cycle not in self.CYCLE_ACTIONS:
+            raise ValueError(f"on_cycle must be one of {', '.join(self.CYCLE_ACTIONS)}")
         self.width = width
         self.height = height
         self.speed = speed if speed is not None else 100
+        self.fps = fps
         self.seed = seed
-        self.game = GameOfLife(width, height, seed)
-        self.generation = 0
+        self.engine = engine
+        self.mode = mode
+        self.checkpoint = checkpoint
+        self.rule = rule
+        self.boundary = boundary
+        self.viewport = Viewport(view_width or width, view_height or height)
         self.paused = False
         self.running = False
-        # Wrap step and clear to track generation
-        original_step = self.game.step
-        original_clear = self.game.clear
-        def wrapped_step():
-            original_step()
-            self.generation += 1
-        def wrapped_clear():
-            original_clear()
-            self.generation = 0
-        self.game.step = wrapped_step
-        self.game.clear = wrapped_clear
+        self.scheduler: Scheduler | None = None
+        # Timings of the step, render, input and sleep phases
+        self.stats = PhaseStats()
+        self.show_stats = False
+        self.metrics = MetricsWriter(metrics) if metrics is not None else None
+        self.on_cycle = on_cycle
+        # Recorder appending every step to a recording, if recording
+        self.recorder: Recorder | None = None
+        self._use_game(create_game(engine, width, height, seed, rule=rule, boundary=boundary))
+        # Events used by run_async: set while the simulation runs, and when
+        # input needs an immediate redraw
+        self._resumed: asyncio.Event | None = None
+        self._redraw: asyncio.Event | None = None
+
+    def _use_game(self, game: GameOfLife) -> None:
+        """Make ``game`` the one being run, releasing the previous one."""
+        previous = getattr(self, "game", None)
+        close = getattr(previous, "close", None)
+        if close is not None:
+            close()
+        self.game = game
+        game.stats = self.stats
+        recorder = getattr(self, "recorder", None)
+        if recorder is not None:
+            if (game.width, game.height) == (previous.width, previous.height):
+                recorder.game = game
+            else:
+                # A recording has one grid size; end it rather than mix sizes
+                recorder.close()
+                self.recorder = None
+        if self.on_cycle is not None:
+            game.track_cycles()
+
+    @property
+    def generation(self) -> int:
+        """Generation counter, kept by the engine."""
+        return self.game.generation
+
+    @generation.setter
+    def generation(self, value: int) -> None:
+        self.game.generation = value
 
     def toggle_pause(self) -> None:
         self.paused = not self.paused
+        if not self.paused and self.scheduler is not None:
+            # Do not try to catch up on the time spent paused
+            self.scheduler.reset()
+
+    def step(self, n: int = 1) -> None:
+        self.game.step(n)
+        if self.recorder is not None and n:
+            self.recorder.record(n)
+        if self.on_cycle is not None and self.game.cycle_period is not None:
+            self._handle_cycle()
 
-    def step(self) -> None:
-        self.game.step()
+    def _handle_cycle(self) -> None:
+        """Apply the ``on_cycle`` action once the grid has settled."""
+        if self.on_cycle == "stop":
+            self.quit()
+        elif self.on_cycle == "reseed":
+            self.randomize()
+        else:
+            self.paused = True
+            # Resuming runs on rather than pausing again on the same cycle
+            self.game.track_cycles()
+
+    def advance(self, n: int) -> None:
+        # One step path, so jumps are recorded and checked for cycles too
+        self.step(n)
 
     def randomize(self) -> None:
-        self.game.randomize()
+        # A replay shows the recording as it was; it cannot be edited
+        if not isinstance(self.game, Replay):
+            self.game.randomize()
 
     def clear(self) -> None:
-        self.game.clear()
+        if not isinstance(self.game, Replay):
+            self.game.clear()
+
+    def save(self) -> None:
+        """Write the game's state to the checkpoint file."""
+        save_checkpoint(self.game, self.checkpoint)
+
+    def load(self) -> None:
+        """Replace the game with the state in the checkpoint file."""
+        # The checkpoint carries the rule and boundary it was saved under
+        self._use_game(load_checkpoint(self.checkpoint, self.engine))
+        self.rule, self.boundary = self.game.rule.notation, self.game.boundary
+
+    def record(self, path: str, keyframe_interval: int = 1000) -> None:
+        """Start recording every step of the game to ``path``."""
+        self.recorder = Recorder(path, self.game, keyframe_interval)
+
+    def replay(self, path: str) -> None:
+        """Play back a recording instead of simulating."""
+        self._use_game(Replay(path))
+
+    def seek(self, generation: int) -> None:
+        """Jump to ``generation`` of the recording being replayed."""
+        if isinstance(self.game, Replay):
+            self.game.seek(generation)
 
     def quit(self) -> None:
         self.running = False
+        # Wake run_async's tasks so they see that the loop is over
+        for event in (self._resumed, self._redraw):
+            if event is not None:
+                event.set()
+
+    def handle_key(self, char: str) -> None:
+        """Apply the control bound to a key press."""
+        if char == ' ':
+            self.toggle_pause()
+        elif char == 'n':
+            self.step()
+        elif char == 'r':
+            self.randomize()
+        elif char == 'c':
+            self.clear()
+        elif char == 'q':
+            self.quit()
+        elif char == 'i':
+            self.show_stats = not self.show_stats
+        elif char in (',', '.'):
+            self.seek(self.generation + (1 if char == '.' else -1))
+        elif char in ('<', '>'):
+            self.seek(self.generation + (self.SEEK_STEP if char == '>' else -self.SEEK_STEP))
+        elif char in ('s', 'o'):
+            try:
+                if char == 's':
+                    self.save()
+                else:
+                    self.load()
+            except (OSError, ValueError):
+                # A missing or damaged checkpoint leaves the game running
+                pass
+        elif char == 'h':
+            self.viewport.pan(-1, 0)
+        elif char == 'l':
+            self.viewport.pan(1, 0)
+        elif char == 'k':
+            self.viewport.pan(0, -1)
+        elif char == 'j':
+            self.viewport.pan(0, 1)
+        elif char in ('+', '='):
+            self.viewport.zoom_in()
+        elif char == '-':
+            self.viewport.zoom_out()
+
+    def render(self, display: Display) -> None:
+        """Draw the visible window with status information."""
+        with self.stats.timer("render"):
+            view = self.viewport
+            cells = view.sample(self.game, shade=display.mode == "cell")
+            stats = self.stats.status() if self.show_stats else None
+            display.render_diff(cells, view.width, view.height, self.generation, self.paused, stats)
+        if self.metrics is not None:
+            self.metrics.maybe_write(self.stats, self.generation, self._dropped_frames())
+
+    def _dropped_frames(self) -> int:
+        return self.scheduler.dropped_frames if self.scheduler is not None else 0
+
+    def _write_metrics(self) -> None:
+        """Write a final metrics record, if metrics are exported."""
+        if self.metrics is not None:
+            self.metrics.write(self.stats, self.generation, self._dropped_frames())
 
     def run(self):
-        """Run the main simulation loop with keyboard controls."""
+        """Run the main simulation loop with keyboard controls.
+
+        Generations and frames are paced separately by a :class:`Scheduler`:
+        several generations may run between two frames, and frames are
+        dropped when rendering cannot keep up.
+        """
         self.running = True
-        display = Display()
+        display = Display(self.mode)
+        self.scheduler = scheduler = Scheduler(1000 / self.speed if self.speed else None, self.fps)
         display.hide_cursor()
         try:
             while self.running:
-                # Render grid with generation info
-                display.render_with_info(self.game.grid, self.width, self.height,
-                                        self.generation, self.paused)
                 if not self.paused:
-                    self.step()
-                if self.speed:
-                    time.sleep(self.speed / 1000)
+                    due = scheduler.due_generations()
+                    if due:
+                        self.step(due)
+                if scheduler.frame_due():
+                    self.render(display)
+                delay = scheduler.sleep_time(self.paused)
+                if delay:
+                    with self.stats.timer("sleep"):
+                        time.sleep(delay)
+        finally:
+            display.show_cursor()
+            self._write_metrics()
+
+    async def run_async(self, stdin: TextIO | None = None) -> None:
+        """Run the simulation on an asyncio event loop.
+
+        Input is read by a reader callback on ``stdin`` and applied as soon
+        as a key arrives; a ``stdin`` that cannot be polled, such as a
+        regular file or ``/dev/null``, is ignored. Simulation ticks and
+        frames run as two tasks paced by a :class:`Scheduler`. While paused
+        both tasks wait on events, so an idle simulation uses no CPU.
+        """
+        stdin = stdin if stdin is not None else sys.stdin
+        loop = asyncio.get_running_loop()
+        fd = stdin.fileno()
+        self.running = True
+        self.scheduler = Scheduler(1000 / self.speed if self.speed else None, self.fps)
+        self._resumed = asyncio.Event()
+        self._redraw = asyncio.Event()
+        if not self.paused:
+            self._resumed.set()
+        display = Display(self.mode)
+
+        def on_input() -> None:
+            data = os.read(fd, 1024)
+            if not data:
+                # End of input: keep running without keyboard controls
+                loop.remove_reader(fd)
+                return
+            with self.stats.timer("input"):
+                for char in data.decode(errors="ignore"):
+                    self.handle_key(char)
+            if self.paused and self.running:
+                self._resumed.clear()
+            else:
+                self._resumed.set()
+            self._redraw.set()
+
+        try:
+            loop.add_reader(fd, on_input)
+            reading = True
+        except OSError:
+            # Regular files and /dev/null cannot be polled; run without keys
+            reading = False
+        display.hide_cursor()
+        try:
+            await asyncio.gather(self._simulate(), self._draw(display))
         finally:
+            if reading:
+                loop.remove_reader(fd)
             display.show_cursor()
+            self._write_metrics()
 
+    async def _simulate(self) -> None:
+        """Step the game whenever generations are due."""
+        scheduler = self.scheduler
+        while self.running:
+            if self.paused:
+                self._resumed.clear()
+                await self._resumed.wait()
+                continue
+            due = scheduler.due_generations()
+            if due:
+                self.step(due)
+            # Sleep until the next tick; sleep(0) still lets input through
+            await asyncio.sleep(scheduler.until_tick())
+
+    async def _draw(self, display: Display) -> None:
+        """Render frames on schedule, and immediately after input."""
+        scheduler = self.scheduler
+        while self.running:
+            if scheduler.frame_due() or self._redraw.is_set():
+                self._redraw.clear()
+                self.render(display)
+            timeout = None if self.paused else scheduler.until_frame()
+            start = self.stats.clock()
+            try:
+                await asyncio.wait_for(self._redraw.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.stats.record("sleep", self.stats.clock() - start)
 
-def main():
+
+def main(argv: List[str] | None = None):
     """Entry point for running the Game of Life from command line.
 
-    Parses command-line arguments and starts the terminal interface.
+    Parses command-line arguments and starts the terminal interface, or
+    dispatches to a subcommand (``momo bench``, ``momo ensemble``).
     """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "bench":
+        from .bench import main as bench_main
+        bench_main(argv[1:])
+        return
+    if argv and argv[0] == "ensemble":
+        from .ensemble import main as ensemble_main
+        ensemble_main(argv[1:])
+        return
+
     parser = argparse.ArgumentParser(
-        description="Conway's Game of Life - Terminal Edition"
+        description="Conway's Game of Life - Terminal Edition",
+        epilog="Run 'momo bench --help' for the headless benchmark and "
+               "'momo ensemble --help' for statistics over many seeds."
     )
     parser.add_argument(
         "--width",
@@ -116,11 +427,29 @@ def main():
         default=25,
         help="Grid height (default: 25)"
     )
+    parser.add_argument(
+        "--view-width",
+        type=int,
+        default=None,
+        help="Width of the visible window (default: grid width)"
+    )
+    parser.add_argument(
+        "--view-height",
+        type=int,
+        default=None,
+        help="Height of the visible window (default: grid height)"
+    )
     parser.add_argument(
         "--speed",
         type=int,
         default=100,
-        help="Delay between generations in milliseconds (default: 100)"
+        help="Delay between generations in milliseconds, 0 for unlimited (default: 100)"
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=30,
+        help="Frames rendered per second, independent of --speed (default: 30)"
     )
     parser.add_argument(
         "--seed",
@@ -128,17 +457,118 @@ def main():
         default=None,
         help="Random seed for deterministic output"
     )
-    args = parser.parse_args()
-
-    interface = TerminalInterface(
-        width=args.width,
-        height=args.height,
-        speed=args.speed,
-        seed=args.seed
+    parser.add_argument(
+        "--metrics",
+        default=None,
+        help="Append phase timings to this file as newline-delimited JSON"
+    )
+    parser.add_argument(
+        "--pattern",
+        default=None,
+        help="Start from an RLE (.rle) or plaintext (.cells) pattern; the grid grows to fit it"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default="momo.ckpt",
+        help="Checkpoint file written by S and read by O (default: momo.ckpt)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from the checkpoint file instead of starting a new grid"
+    )
+    parser.add_argument(
+        "--record",
+        default=None,
+        help="Record the run to this file as keyframes and per-generation deltas"
+    )
+    parser.add_argument(
+        "--replay",
+        default=None,
+        help="Play back a recording; ,/. step and </> seek through it"
     )
+    parser.add_argument(
+        "--on-cycle",
+        choices=TerminalInterface.CYCLE_ACTIONS,
+        default=None,
+        help="Pause, reseed or stop once the grid settles into a still life or oscillator"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default="list",
+        help="Stepping engine (default: list)"
+    )
+    parser.add_argument(
+        "--rule",
+        default=None,
+        help="Life-like rule in B/S notation, e.g. B36/S23 for HighLife (default: the pattern's rule, else B3/S23)"
+    )
+    parser.add_argument(
+        "--boundary",
+        choices=BOUNDARIES,
+        default="torus",
+        help="Edge handling: wrap around, dead cells beyond the edge, or mirrored edge cells (default: torus)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=sorted(MODES),
+        default="cell",
+        help="Display mode: one cell per character, half blocks (1x2) or Braille (2x4) (default: cell)"
+    )
+    args = parser.parse_args(argv)
+
+    width, height = args.width, args.height
+    rule = args.rule
+    if args.pattern:
+        try:
+            pattern_width, pattern_height = pattern_size(args.pattern)
+            # An RLE pattern runs under the rule its header names
+            rule = rule or pattern_rule(args.pattern)
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot load pattern: {exc}")
+        width, height = max(width, pattern_width), max(height, pattern_height)
+
+    metrics = open(args.metrics, "a", encoding="utf-8") if args.metrics else None
+    try:
+        interface = TerminalInterface(
+            width=width,
+            height=height,
+            speed=args.speed,
+            seed=args.seed,
+            engine=args.engine,
+            mode=args.mode,
+            view_width=args.view_width or args.width,
+            view_height=args.view_height or args.height,
+            fps=args.fps,
+            metrics=metrics,
+            on_cycle=args.on_cycle,
+            checkpoint=args.checkpoint,
+            rule=rule or "B3/S23",
+            boundary=args.boundary
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.resume:
+        try:
+            interface.load()
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot resume: {exc}")
+        width, height = interface.game.width, interface.game.height
+    elif args.replay:
+        try:
+            interface.replay(args.replay)
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot replay: {exc}")
+        width, height = interface.game.width, interface.game.height
+    elif args.pattern:
+        load_pattern(args.pattern, interface.game)
+    if args.record:
+        interface.record(args.record)
 
-    print(f"Game of Life initialized: {args.width}x{args.height}")
-    print("Controls: Space=Pause, N=Step, R=Random, C=Clear, Q=Quit")
+    print(f"Game of Life initialized: {width}x{height}")
+    print("Controls: Space=Pause, N=Step, R=Random, C=Clear, Q=Quit, HJKL=Pan, +/-=Zoom, "
+          "I=Stats, S=Save, O=Load, ,/.=Scrub, </>=Seek")
 
     # Set up terminal for raw input if possible
     old_settings = None
@@ -149,23 +579,14 @@ def main():
         pass
 
     try:
-        while interface.running:
-            # Handle keyboard input
-            if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                char = sys.stdin.read(1)
-                if char == ' ':
-                    interface.toggle_pause()
-                elif char == 'n':
-                    interface.step()
-                elif char == 'r':
-                    interface.randomize()
-                elif char == 'c':
-                    interface.clear()
-                elif char == 'q':
-                    interface.quit()
+        asyncio.run(interface.run_async())
     finally:
         if old_settings:
             try:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
             except (termios.error, OSError):
-                pass
\ No newline at end of file
+                pass
+        if metrics is not None:
+            metrics.close()
+        if interface.recorder is not None:
+            interface.recorder.close()
\ No newline at end of file
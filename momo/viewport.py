@@ -0,0 +1,103 @@
+"""Viewport onto worlds larger than the terminal."""
+
+from typing import List
+
+from .core import GameOfLife, unpack_row
+
+# Shade codes understood by Display in "cell" mode.
+EMPTY, FULL, SPARSE, DENSE = 0, 1, 2, 3
+
+
+class Viewport:
+    """Camera showing a window of a world through a fixed-size screen.
+
+    The viewport's top-left world cell is (``x``, ``y``) and every screen
+    cell covers a ``zoom x zoom`` block of world cells. Only the visible
+    window is read from the engine, as packed rows. When zoomed out, each
+    block is aggregated with popcounts over packed row slices rather than by
+    visiting its cells. Blocks become a density shade code (``EMPTY``,
+    ``SPARSE``, ``DENSE``, ``FULL``) or, with ``shade=False``, plain alive
+    flags for the packed display modes.
+    """
+
+    MAX_ZOOM = 64
+    # Screen cells moved by one pan step
+    PAN_STEP = 4
+
+    def __init__(self, width: int, height: int, x: int = 0, y: int = 0, zoom: int = 1):
+        """
+        Initialize the viewport.
+
+        Args:
+            width: Screen width in screen cells
+            height: Screen height in screen cells
+            x: World column shown in the leftmost screen column
+            y: World row shown in the top screen row
+            zoom: World cells per screen cell along each axis
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be positive")
+        if not 1 <= zoom <= self.MAX_ZOOM:
+            raise ValueError(f"zoom must be between 1 and {self.MAX_ZOOM}")
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+
+    def pan(self, dx: int, dy: int) -> None:
+        """Move the viewport by ``dx`` and ``dy`` pan steps."""
+        self.x += dx * self.PAN_STEP * self.zoom
+        self.y += dy * self.PAN_STEP * self.zoom
+
+    def zoom_in(self) -> None:
+        """Halve the block size, keeping the center of the view in place."""
+        self._set_zoom(max(1, self.zoom // 2))
+
+    def zoom_out(self) -> None:
+        """Double the block size, keeping the center of the view in place."""
+        self._set_zoom(min(self.MAX_ZOOM, self.zoom * 2))
+
+    def _set_zoom(self, zoom: int) -> None:
+        """Change the zoom around the center of the view."""
+        center_x = self.x + self.width * self.zoom // 2
+        center_y = self.y + self.height * self.zoom // 2
+        self.zoom = zoom
+        self.x = center_x - self.width * zoom // 2
+        self.y = center_y - self.height * zoom // 2
+
+    def sample(self, game: GameOfLife, shade: bool = True) -> List[List[int]]:
+        """
+        Return the screen contents as rows of codes for :class:`Display`.
+
+        At zoom 1 the codes are the cells themselves (0 dead, 1 alive).
+
+        Args:
+            game: Engine to read the visible window from
+            shade: Aggregate zoomed-out blocks into density shades rather
+                than marking any block with a live cell as alive
+        """
+        zoom = self.zoom
+        rows = game.get_region_bits(self.x, self.y, self.width * zoom, self.height * zoom)
+        if zoom == 1:
+            return [unpack_row(bits, self.width) for bits in rows]
+        area = zoom * zoom
+        block_mask = (1 << zoom) - 1
+        screen = []
+        for top in range(0, len(rows), zoom):
+            counts = [0] * self.width
+            for bits in rows[top:top + zoom]:
+                column = 0
+                while bits:
+                    counts[column] += (bits & block_mask).bit_count()
+                    bits >>= zoom
+                    column += 1
+            if shade:
+                screen.append([
+                    EMPTY if count == 0 else FULL if count == area
+                    else SPARSE if 2 * count < area else DENSE
+                    for count in counts
+                ])
+            else:
+                screen.append([1 if count else 0 for count in counts])
+        return screen
@@ -0,0 +1,68 @@
+"""Tests for the batched NumPy engine."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from momo.batch import BatchGameOfLife  # noqa: E402
+from momo.core import GameOfLife  # noqa: E402
+
+
+def test_boards_match_reference():
+    """Test every board evolves like a separate reference game."""
+    batch = BatchGameOfLife(4, 13, 9)
+    batch.randomize([1, 2, 3, 4])
+    references = []
+    for board in range(4):
+        game = GameOfLife(13, 9)
+        game.grid = batch.get_grid(board)
+        references.append(game)
+    batch.step(10)
+    for board, game in enumerate(references):
+        game.step(10)
+        # Settled boards are dead or static, so they still match too
+        assert batch.get_grid(board) == game.grid
+
+
+def test_settled_boards_drop_out():
+    """Test dead and static boards leave the active set."""
+    batch = BatchGameOfLife(3, 8, 8)
+    block = [[x in (2, 3) and y in (2, 3) for x in range(8)] for y in range(8)]
+    blinker = [[y == 4 and 2 <= x <= 4 for x in range(8)] for y in range(8)]
+    batch.set_grid(1, block)
+    batch.set_grid(2, blinker)
+    batch.step(5)
+    assert batch.active.tolist() == [False, False, True]
+    assert batch.settled_at.tolist() == [1, 1, -1]
+    assert batch.population().tolist() == [0, 4, 3]
+    assert batch.generation == 5
+
+
+def test_stops_when_all_settled():
+    """Test stepping an all-settled batch only advances the counter."""
+    batch = BatchGameOfLife(2, 5, 5)
+    batch.step(3)
+    assert not batch.active.any()
+    assert batch.generation == 3
+
+
+def test_other_rule_matches_reference():
+    """Test boards play the batch's rule."""
+    batch = BatchGameOfLife(3, 11, 10, rule="B36/S23")
+    batch.randomize([5, 6, 7])
+    references = [GameOfLife(11, 10, rule="B36/S23") for _ in range(3)]
+    for board, game in enumerate(references):
+        game.grid = batch.get_grid(board)
+    batch.step(6)
+    for board, game in enumerate(references):
+        game.step(6)
+        # Settled boards are dead or static, so they still match too
+        assert batch.get_grid(board) == game.grid
+
+
+def test_invalid_arguments():
+    """Test bad sizes and seed counts are rejected."""
+    with pytest.raises(ValueError):
+        BatchGameOfLife(0)
+    with pytest.raises(ValueError):
+        BatchGameOfLife(2).randomize([1])
@@ -0,0 +1,42 @@
+"""Tests for the headless benchmark."""
+
+import json
+
+import pytest
+from momo.bench import run_benchmark
+from momo.terminal import main
+
+
+def test_run_benchmark_reports_metrics():
+    """Test a benchmark run reports rates, memory and latencies."""
+    result = run_benchmark(20, 10, 5, "bitboard", seed=1)
+    assert result["generations"] == 5
+    assert result["generations_per_sec"] > 0
+    assert result["cells_per_sec"] == pytest.approx(result["generations_per_sec"] * 200)
+    assert result["peak_rss_bytes"] > 0
+    assert result["latency_p50"] <= result["latency_p90"] <= result["latency_p99"]
+
+
+def test_run_benchmark_rejects_bad_arguments():
+    """Test invalid sizes and generation counts are rejected."""
+    with pytest.raises(ValueError):
+        run_benchmark(0, 10)
+    with pytest.raises(ValueError):
+        run_benchmark(10, 10, 0)
+
+
+def test_bench_subcommand_json(capsys):
+    """Test ``momo bench --json`` prints one JSON result."""
+    main(["bench", "--width", "8", "--height", "8", "--generations", "3", "--seed", "2", "--json"])
+    result = json.loads(capsys.readouterr().out)
+    assert result["engine"] == "list"
+    assert result["width"] == 8
+    assert result["seed"] == 2
+
+
+def test_bench_subcommand_text(capsys):
+    """Test the default output is human-readable."""
+    main(["bench", "--generations", "2"])
+    out = capsys.readouterr().out
+    assert "generations/s" in out
+    assert "p99" in out
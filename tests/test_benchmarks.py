@@ -0,0 +1,29 @@
+"""Tests for the benchmark suite's regression gate."""
+
+from benchmarks.suite import compare, main, random_grid
+
+
+def test_compare_flags_slowdowns_past_threshold():
+    """Test only cases slower than baseline * (1 + threshold) regress."""
+    baseline = {"a": 1.0, "b": 1.0, "c": 1.0}
+    results = {"a": 1.1, "b": 1.3, "d": 5.0}
+    assert compare(results, baseline, 0.2) == [("b", 1.0, 1.3)]
+
+
+def test_random_grid_density():
+    """Test random grids are reproducible and near the requested density."""
+    grid = random_grid(100, 100, 0.1)
+    assert grid == random_grid(100, 100, 0.1)
+    alive = sum(map(sum, grid))
+    assert 800 < alive < 1200
+
+
+def test_baseline_round_trip(tmp_path, capsys):
+    """Test a saved baseline gates the next run."""
+    path = tmp_path / "baseline.json"
+    args = ["--quick", "-k", "render[50x25,d0.1]", "--baseline", str(path)]
+    assert main(args + ["--save"]) == 0
+    assert path.exists()
+    path.write_text('{"render[50x25,d0.1]": 1e-12}')
+    assert main(args) == 1
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,101 @@
+"""Tests for binary checkpoints."""
+
+import pytest
+from momo import checkpoint
+from momo.checkpoint import load_checkpoint, save_checkpoint
+from momo.core import GameOfLife
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(tmp_path, compress):
+    """Test grid, generation and RNG state survive a checkpoint."""
+    game = GameOfLife(37, 11, seed=4)
+    game.randomize()
+    game.step(3)
+    path = tmp_path / "game.ckpt"
+    save_checkpoint(game, path, compress=compress)
+    restored = load_checkpoint(path)
+    assert (restored.width, restored.height, restored.generation) == (37, 11, 3)
+    assert restored.grid == game.grid
+    assert restored.rng.random() == game.rng.random()
+
+
+def test_compressed_body_split_at_any_chunk(tmp_path, monkeypatch):
+    """Test the trailer is found wherever a read ends near the end of the body."""
+    game = GameOfLife(200, 200)
+    game.randomize(seed=2)
+    path = tmp_path / "game.ckpt"
+    save_checkpoint(game, path, compress=True)
+    texts = 2 * checkpoint._TEXT.size + len("B3/S23") + len("torus")
+    body = (path.stat().st_size - checkpoint._HEADER.size - texts - checkpoint._RNG.size
+            - checkpoint._TRAILER.size)
+    for delta in range(-2, 10):
+        monkeypatch.setattr(checkpoint, "CHUNK_SIZE", body - delta)
+        assert load_checkpoint(path).grid == game.grid
+
+
+def test_restores_rule(tmp_path):
+    """Test a checkpoint plays on under the rule it was saved with."""
+    game = GameOfLife(12, 12, rule="B36/S23")
+    game.randomize(seed=3)
+    path = tmp_path / "game.ckpt"
+    save_checkpoint(game, path)
+    restored = load_checkpoint(path, "bitboard")
+    assert restored.rule.notation == "B36/S23"
+    game.step(4)
+    restored.step(4)
+    assert restored.grid == game.grid
+    assert load_checkpoint(path, rule="S23/B36").rule == game.rule
+    with pytest.raises(ValueError):
+        load_checkpoint(path, rule="B3/S23")
+
+
+def test_restores_boundary(tmp_path):
+    """Test a checkpoint keeps the edge handling it was saved with."""
+    game = GameOfLife(10, 6, boundary="mirror")
+    game.randomize(seed=5)
+    path = tmp_path / "game.ckpt"
+    save_checkpoint(game, path, compress=True)
+    restored = load_checkpoint(path, "numpy")
+    assert restored.boundary == "mirror"
+    game.step(3)
+    restored.step(3)
+    assert restored.grid == game.grid
+    with pytest.raises(ValueError):
+        load_checkpoint(path, boundary="torus")
+
+
+def test_size_is_bit_packed(tmp_path):
+    """Test rows take one bit per cell."""
+    game = GameOfLife(80, 40)
+    path = tmp_path / "game.ckpt"
+    save_checkpoint(game, path)
+    assert path.stat().st_size < 80 * 40 // 8 + 2600
+
+
+@pytest.mark.parametrize("engine", ["bitboard", "sparse", "hashlife"])
+def test_restore_into_engine(tmp_path, engine):
+    """Test checkpoints restore into any engine."""
+    game = GameOfLife(16, 9)
+    game.randomize(seed=8)
+    path = tmp_path / "game.ckpt"
+    save_checkpoint(game, path, compress=True)
+    assert load_checkpoint(path, engine).grid == game.grid
+
+
+def test_rejects_damaged_files(tmp_path):
+    """Test foreign, truncated and corrupted files are rejected."""
+    path = tmp_path / "game.ckpt"
+    path.write_bytes(b"not a checkpoint at all" * 10)
+    with pytest.raises(ValueError):
+        load_checkpoint(path)
+    game = GameOfLife(16, 16)
+    game.randomize(seed=1)
+    save_checkpoint(game, path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+    with pytest.raises(ValueError):
+        load_checkpoint(path)
+    path.write_bytes(data[:-8] + bytes([data[-8] ^ 1]) + data[-7:])
+    with pytest.raises(ValueError):
+        load_checkpoint(path)
@@ -1,7 +1,32 @@
 """Tests for Game of Life core logic."""
 
 import pytest
-from momo.core import GameOfLife
+from momo.core import GameOfLife, axis_neighbors
+
+
+def naive_step(grid, boundary):
+    """Step Conway's rule once, resolving every neighbor coordinate in place."""
+    height, width = len(grid), len(grid[0])
+    after = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            count = 0
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    nx, ny = x + dx, y + dy
+                    if not (dx or dy):
+                        continue
+                    if boundary == "torus":
+                        nx, ny = nx % width, ny % height
+                    elif boundary == "mirror":
+                        nx, ny = min(max(nx, 0), width - 1), min(max(ny, 0), height - 1)
+                    elif not (0 <= nx < width and 0 <= ny < height):
+                        continue
+                    count += grid[ny][nx]
+            row.append(count == 3 or (grid[y][x] and count == 2))
+        after.append(row)
+    return after
 
 
 class TestGameOfLife:
@@ -58,6 +83,36 @@ class TestGameOfLife:
         neighbors = game._get_neighbors(0, 0)
         assert neighbors == 2
 
+    @pytest.mark.parametrize("boundary, expected", [("torus", 2), ("dead", 0), ("mirror", 3)])
+    def test_boundary_neighbors(self, boundary, expected):
+        """Test corner neighbor counts under each boundary mode."""
+        game = GameOfLife(5, 5, boundary=boundary)
+        game.set_cell(0, 0, True)
+        game.set_cell(0, 4, True)
+        game.set_cell(4, 0, True)
+        assert game._get_neighbors(0, 0) == expected
+
+    def test_axis_neighbors(self):
+        """Test the precomputed neighbor tables of each mode."""
+        assert axis_neighbors(3, "torus") == ((2, 1), (0, 2), (1, 0))
+        assert axis_neighbors(3, "dead") == ((None, 1), (0, 2), (1, None))
+        assert axis_neighbors(3, "mirror") == ((0, 1), (0, 2), (1, 2))
+        assert axis_neighbors(1, "dead") == ((None, None),)
+        with pytest.raises(ValueError):
+            GameOfLife(5, 5, boundary="klein")
+
+    @pytest.mark.parametrize("boundary", ["torus", "dead", "mirror"])
+    @pytest.mark.parametrize("width, height", [(17, 11), (1, 4), (3, 1)])
+    def test_boundary_matches_naive(self, boundary, width, height):
+        """Test stepping matches a per-cell reference under each boundary mode."""
+        game = GameOfLife(width, height, seed=5, randomize=True, boundary=boundary)
+        grid = game.grid
+        for _ in range(8):
+            grid = naive_step(grid, boundary)
+        game.step(3)
+        game.step(5)
+        assert game.grid == grid
+
     def test_underpopulation(self):
         """Test underpopulation rule."""
         game = GameOfLife(5, 5)
@@ -167,4 +222,111 @@ class TestGameOfLife:
         assert game.get_cell(1, 1) is True
         assert game.get_cell(1, 2) is True
         assert game.get_cell(2, 1) is True
-        assert game.get_cell(2, 2) is True
\ No newline at end of file
+        assert game.get_cell(2, 2) is True
+
+    def test_step_many_matches_single_steps(self):
+        """Test step(n) matches n single steps and counts generations once."""
+        game1 = GameOfLife(12, 9)
+        game1.randomize(seed=5)
+        game2 = GameOfLife(12, 9)
+        game2.randomize(seed=5)
+        game1.step(7)
+        for _ in range(7):
+            game2.step()
+        assert game1.grid == game2.grid
+        assert game1.generation == game2.generation == 7
+
+    def test_advance(self):
+        """Test advance(n) is the same as step(n)."""
+        game = GameOfLife(5, 5)
+        game.set_cell(1, 2, True)
+        game.set_cell(2, 2, True)
+        game.set_cell(3, 2, True)
+        game.advance(3)
+        assert game.generation == 3
+        assert game.get_cell(2, 1) is True
+
+    def test_step_negative(self):
+        """Test a negative generation count is rejected."""
+        game = GameOfLife(5, 5)
+        with pytest.raises(ValueError):
+            game.step(-1)
+
+    def test_clear_resets_generation(self):
+        """Test clearing resets the generation counter."""
+        game = GameOfLife(5, 5)
+        game.step(4)
+        game.clear()
+        assert game.generation == 0
+
+    def test_stable_tiles_are_skipped(self):
+        """Test a still life leaves nothing to re-evaluate or report."""
+        game = GameOfLife(40, 40)
+        game.set_cell(1, 1, True)
+        game.set_cell(1, 2, True)
+        game.set_cell(2, 1, True)
+        game.set_cell(2, 2, True)
+        game.step()
+        assert game.changed == set()
+        assert game._dirty == set()
+
+    def test_changed_tracks_blinker(self):
+        """Test changed reports the flipped cells of a blinker."""
+        game = GameOfLife(40, 40)
+        game.set_cell(19, 20, True)
+        game.set_cell(20, 20, True)
+        game.set_cell(21, 20, True)
+        game.step()
+        assert game.changed == {(19, 20), (21, 20), (20, 19), (20, 21)}
+        game.step()
+        assert game.changed == {(19, 20), (21, 20), (20, 19), (20, 21)}
+        # A full period flips every cell back
+        game.step(2)
+        assert game.changed == set()
+
+    def test_writes_through_grid_rows_are_stepped(self):
+        """Test cells written into the rows of grid wake up a settled board."""
+        game = GameOfLife(12, 12)
+        game.track_cycles()
+        game.step()
+        game.grid[5][5:8] = [True, True, True]
+        game.step()
+        assert [game.get_cell(6, y) for y in (4, 5, 6)] == [True, True, True]
+        assert game.get_cell(5, 5) is False
+        reference = GameOfLife(12, 12)
+        for y in (4, 5, 6):
+            reference.set_cell(6, y, True)
+        assert game.state_hash() == reference.state_hash()
+
+    def test_state_hash_tracks_flips(self):
+        """Test the incremental hash matches a full recomputation."""
+        game = GameOfLife(12, 12)
+        game.randomize(seed=3)
+        game.track_cycles()
+        for _ in range(5):
+            game.step()
+            incremental = game.state_hash()
+            game._hash = None
+            assert game.state_hash() == incremental
+
+    def test_cycle_detection_still_life_and_blinker(self):
+        """Test still lifes report period 1 and blinkers period 2."""
+        block = GameOfLife(6, 6)
+        for x, y in [(1, 1), (2, 1), (1, 2), (2, 2)]:
+            block.set_cell(x, y, True)
+        assert block.run_until_cycle(10) == 1
+        blinker = GameOfLife(5, 5)
+        for x in range(1, 4):
+            blinker.set_cell(x, 2, True)
+        assert blinker.run_until_cycle(10) == 2
+
+    def test_cycle_history_reset_by_edits(self):
+        """Test direct edits clear the hash history."""
+        game = GameOfLife(5, 5)
+        game.track_cycles()
+        game.step()
+        assert game.cycle_period == 1
+        game.set_cell(0, 0, True)
+        assert game.cycle_period is None
+        with pytest.raises(ValueError):
+            game.track_cycles(0)
@@ -0,0 +1,206 @@
+"""Conformance tests shared by every Game of Life engine."""
+
+import importlib.util
+
+import pytest
+from momo.core import GameOfLife
+from momo.engines import ENGINES, create_game, get_engine
+from momo.terminal import TerminalInterface
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+ENGINE_NAMES = [
+    "list",
+    pytest.param("numpy", marks=pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")),
+    "bitboard",
+    "sparse",
+    "parallel",
+    "mmap",
+]
+
+
+def reference_run(width, height, seed, generations):
+    """Return the reference grid after stepping a random soup."""
+    game = GameOfLife(width, height)
+    game.randomize(seed=seed)
+    for _ in range(generations):
+        game.step()
+    return game.grid
+
+
+@pytest.mark.parametrize("engine", ENGINE_NAMES)
+class TestEngineConformance:
+    """Every engine must match the reference list engine."""
+
+    @pytest.mark.parametrize("width,height", [(10, 10), (17, 9), (1, 5), (6, 1), (2, 3)])
+    def test_matches_reference(self, engine, width, height):
+        """Test random soups evolve exactly like the reference engine."""
+        game = create_game(engine, width, height)
+        game.randomize(seed=7)
+        for _ in range(12):
+            game.step()
+        assert game.grid == reference_run(width, height, 7, 12)
+
+    def test_set_get_cell(self, engine):
+        """Test setting and getting cells."""
+        game = create_game(engine, 8, 6)
+        game.set_cell(7, 5, True)
+        assert game.get_cell(7, 5) is True
+        assert game.grid[5][7] is True
+        game.set_cell(7, 5, False)
+        assert game.get_cell(7, 5) is False
+
+    def test_toroidal_glider(self, engine):
+        """Test a glider wraps around and returns after 4 * size generations."""
+        game = create_game(engine, 8, 8)
+        for x, y in [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]:
+            game.set_cell(x, y, True)
+        initial = game.grid
+        for _ in range(32):
+            game.step()
+        assert game.grid == initial
+
+    def test_clear(self, engine):
+        """Test clearing the grid."""
+        game = create_game(engine, 5, 5, randomize=True, seed=1)
+        game.clear()
+        assert all(not cell for row in game.grid for cell in row)
+
+    def test_randomize_matches_reference(self, engine):
+        """Test the same seed produces the same grid on every engine."""
+        game = create_game(engine, 9, 4)
+        game.randomize(seed=42)
+        reference = GameOfLife(9, 4)
+        reference.randomize(seed=42)
+        assert game.grid == reference.grid
+
+    def test_row_bits_round_trip(self, engine):
+        """Test packed rows read and write the same cells as get/set_cell."""
+        game = create_game(engine, 11, 3)
+        game.set_cell(0, 1, True)
+        game.set_cell(10, 1, True)
+        assert game.get_row_bits(1) == (1 << 10) | 1
+        game.set_row_bits(2, 0b101)
+        assert game.grid[2][:4] == [True, False, True, False]
+        assert game.get_row_bits(2) == 0b101
+
+    def test_changed_cells(self, engine):
+        """Test changed holds exactly the cells flipped by the last step."""
+        game = create_game(engine, 13, 11)
+        game.randomize(seed=9)
+        game.step(2)
+        before = [row[:] for row in game.grid]
+        game.step(3)
+        if game.changed is None:
+            pytest.skip("engine does not track flipped cells")
+        after = game.grid
+        expected = {(x, y) for y in range(11) for x in range(13) if before[y][x] != after[y][x]}
+        assert game.changed == expected
+
+    def test_edits_between_steps(self, engine):
+        """Test cells set on a settled grid are picked up by the next step."""
+        game = create_game(engine, 20, 20)
+        game.randomize(seed=4)
+        game.step(40)
+        game.set_cell(10, 10, True)
+        game.set_cell(11, 10, True)
+        game.set_row_bits(3, 0b111 << 15)
+        reference = GameOfLife(20, 20)
+        reference.grid = [row[:] for row in game.grid]
+        game.step(5)
+        reference.step(5)
+        assert game.grid == reference.grid
+
+    def test_region(self, engine):
+        """Test windows read from the engine wrap around the torus."""
+        game = create_game(engine, 9, 7)
+        game.randomize(seed=2)
+        grid = game.grid
+        region = game.get_region(6, 5, 5, 4)
+        assert region == [[grid[(5 + j) % 7][(6 + i) % 9] for i in range(5)] for j in range(4)]
+
+    @pytest.mark.parametrize("boundary", ["dead", "mirror"])
+    def test_region_outside_bounded_grid(self, engine, boundary):
+        """Test windows over the edge of a bounded grid read dead cells there."""
+        if engine == "sparse":
+            pytest.skip("sparse engine only supports the torus")
+        game = create_game(engine, 9, 7, boundary=boundary)
+        game.randomize(seed=2)
+        grid = game.grid
+
+        def cell(x, y):
+            return 0 <= x < 9 and 0 <= y < 7 and grid[y][x]
+
+        region = game.get_region(-2, 4, 13, 5)
+        assert region == [[cell(i - 2, j + 4) for i in range(13)] for j in range(5)]
+
+    def test_terminal_interface(self, engine):
+        """Test the terminal interface drives the engine."""
+        interface = TerminalInterface(6, 6, 0, None, engine=engine)
+        interface.game.set_cell(1, 2, True)
+        interface.game.set_cell(2, 2, True)
+        interface.game.set_cell(3, 2, True)
+        interface.step()
+        assert interface.generation == 1
+        assert interface.game.get_cell(2, 1) is True
+
+    def test_cycle_detection(self, engine):
+        """Test every engine keeps the hash in step with its flips."""
+        game = create_game(engine, 8, 8)
+        for x in range(2, 5):
+            game.set_cell(x, 3, True)
+        assert game.run_until_cycle(10) == 2
+        reference = GameOfLife(8, 8)
+        reference.grid = [row[:] for row in game.grid]
+        assert game.state_hash() == reference.state_hash()
+
+    @pytest.mark.parametrize("boundary", ["dead", "mirror"])
+    def test_boundaries(self, engine, boundary):
+        """Test non-toroidal boundaries evolve and count like the reference engine."""
+        if engine == "sparse":
+            pytest.skip("sparse engine only supports the torus")
+        game = create_game(engine, 13, 9, seed=3, randomize=True, boundary=boundary)
+        reference = GameOfLife(13, 9, seed=3, randomize=True, boundary=boundary)
+        assert [game._get_neighbors(x, y) for y in range(9) for x in range(13)] == \
+            [reference._get_neighbors(x, y) for y in range(9) for x in range(13)]
+        game.step(7)
+        reference.step(7)
+        assert game.grid == reference.grid
+
+    @pytest.mark.parametrize("rule", ["B36/S23", "B3678/S34678", "B2/S", "B0/S8"])
+    def test_other_rules(self, engine, rule):
+        """Test Life-like rules evolve exactly like the reference engine."""
+        if engine == "sparse" and rule.startswith("B0"):
+            pytest.skip("sparse engine cannot play B0 rules")
+        game = create_game(engine, 14, 11, seed=8, randomize=True, rule=rule)
+        reference = GameOfLife(14, 11, seed=8, randomize=True, rule=rule)
+        game.step(9)
+        reference.step(9)
+        assert game.grid == reference.grid
+
+
+def test_get_engine_unknown():
+    """Test unknown engine names are rejected."""
+    with pytest.raises(ValueError):
+        get_engine("abacus")
+
+
+def test_registered_engines_are_named():
+    """Test the default engine is the reference implementation."""
+    assert "list" in ENGINES
+    assert get_engine("list") is GameOfLife
+
+
+@pytest.mark.parametrize("engine", ["sparse", "hashlife"])
+def test_unbounded_engines_reject_boundaries(engine):
+    """Test engines without a bounded grid refuse other boundary modes."""
+    with pytest.raises(ValueError):
+        create_game(engine, 8, 8, boundary="dead")
+
+
+def test_randomize_on_init():
+    """Test randomize=True fills the grid at construction."""
+    game = GameOfLife(10, 10, seed=3, randomize=True)
+    reference = GameOfLife(10, 10)
+    reference.randomize(seed=3)
+    assert game.grid == reference.grid
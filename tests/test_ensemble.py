@@ -0,0 +1,63 @@
+"""Tests for the parallel ensemble runner."""
+
+import json
+
+import pytest
+from momo.core import GameOfLife
+from momo.engines import create_game
+from momo.ensemble import parse_seeds, run_ensemble, summarize_seed
+from momo.terminal import main
+
+
+def test_summarize_seed_matches_serial_run():
+    """Test a summary describes the soup's own evolution."""
+    summary = summarize_seed((3, 16, 16, 500, "bitboard", "B3/S23"))
+    game = GameOfLife(16, 16, seed=3, randomize=True)
+    period = game.run_until_cycle(500)
+    assert summary["seed"] == 3
+    assert summary["stabilized"] is (period is not None)
+    assert summary["period"] == period
+    assert summary["final_population"] == game.population()
+    assert summary["lifespan"] == game.generation - (period or 0)
+
+
+def test_results_independent_of_workers():
+    """Test summaries come back in seed order for any worker count."""
+    seeds = list(range(10))
+    serial = list(run_ensemble(seeds, 12, 12, 200, workers=1))
+    parallel = list(run_ensemble(seeds, 12, 12, 200, workers=2, chunksize=3))
+    assert [summary["seed"] for summary in serial] == seeds
+    assert parallel == serial
+
+
+def test_parse_seeds():
+    """Test seed lists accept numbers and inclusive ranges."""
+    assert parse_seeds("0-3,7, 9-10") == [0, 1, 2, 3, 7, 9, 10]
+    with pytest.raises(ValueError):
+        parse_seeds("a-b")
+
+
+def test_population():
+    """Test live cells are counted."""
+    game = GameOfLife(6, 6)
+    game.set_cell(1, 1, True)
+    game.set_cell(4, 5, True)
+    assert game.population() == 2
+
+
+@pytest.mark.parametrize("engine", ["sparse", "hashlife"])
+def test_population_counts_cells_outside_window(engine):
+    """Test unbounded engines count the whole universe, not only the window."""
+    options = {"wrap": False} if engine == "sparse" else {}
+    game = create_game(engine, 6, 6, **options)
+    game.set_cell(1, 1, True)
+    game.set_cell(-40, 900, True)
+    assert game.population() == 2
+
+
+def test_ensemble_subcommand(capsys):
+    """Test ``momo ensemble`` prints one JSON summary per seed."""
+    main(["ensemble", "--seeds", "5-7", "--width", "10", "--height", "10",
+          "--generations", "50", "--workers", "1"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["seed"] for line in lines] == [5, 6, 7]
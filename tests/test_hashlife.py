@@ -0,0 +1,89 @@
+"""Tests for the HashLife engine."""
+
+import pytest
+from momo.hashlife import HashLifeGameOfLife
+from momo.sparse import SparseGameOfLife
+from momo.terminal import TerminalInterface
+
+GLIDER = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+
+def live_cells(game, low=-48, high=80):
+    """Return the live cells of ``game`` inside a square region."""
+    return {(x, y) for y in range(low, high) for x in range(low, high) if game.get_cell(x, y)}
+
+
+class TestHashLifeGameOfLife:
+    """Tests for HashLifeGameOfLife class."""
+
+    def test_set_get_cell(self):
+        """Test setting and getting cells, including outside the window."""
+        game = HashLifeGameOfLife(10, 10)
+        game.set_cell(3, 4, True)
+        game.set_cell(-500, 900, True)
+        assert game.get_cell(3, 4) is True
+        assert game.get_cell(-500, 900) is True
+        assert game.grid[4][3] is True
+        game.set_cell(3, 4, False)
+        assert game.get_cell(3, 4) is False
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_sparse_plane(self, seed):
+        """Test random soups evolve like the unbounded sparse engine."""
+        game = HashLifeGameOfLife(16, 16, seed=seed, randomize=True)
+        reference = SparseGameOfLife(16, 16, seed=seed, randomize=True, wrap=False)
+        for n in (1, 2, 3, 7, 16):
+            game.advance(n)
+            for _ in range(n):
+                reference.step()
+            assert live_cells(game) == {(x, y) for x, y in reference.live if -48 <= x < 80 and -48 <= y < 80}
+            assert game.root.population == len(reference.live)
+
+    @pytest.mark.parametrize("rule", ["B36/S23", "B3678/S34678", "B34/S34"])
+    def test_other_rules_match_sparse_plane(self, rule):
+        """Test Life-like rules evolve like the unbounded sparse engine."""
+        game = HashLifeGameOfLife(16, 16, seed=3, randomize=True, rule=rule)
+        reference = SparseGameOfLife(16, 16, seed=3, randomize=True, rule=rule, wrap=False)
+        game.advance(20)
+        reference.step(20)
+        assert game.root.population == len(reference.live)
+        assert live_cells(game) == {(x, y) for x, y in reference.live if -48 <= x < 80 and -48 <= y < 80}
+
+    def test_advance_power_of_two(self):
+        """Test a glider jumps a million generations in one call."""
+        game = HashLifeGameOfLife(10, 10)
+        for x, y in GLIDER:
+            game.set_cell(x, y, True)
+        game.advance(2 ** 20)
+        shift = 2 ** 18
+        assert all(game.get_cell(x + shift, y + shift) for x, y in GLIDER)
+        assert game.root.population == 5
+
+    def test_bounded_memory(self):
+        """Test the node table is collected once it exceeds max_nodes."""
+        game = HashLifeGameOfLife(32, 32, seed=5, randomize=True, max_nodes=500, max_cache=200)
+        for _ in range(10):
+            game.advance(8)
+        assert len(game._cache) <= 200
+        reference = SparseGameOfLife(32, 32, seed=5, randomize=True, wrap=False)
+        for _ in range(80):
+            reference.step()
+        assert game.root.population == len(reference.live)
+
+    def test_glider_leaving_window_is_not_a_cycle(self):
+        """Test the cycle hash covers the whole universe, not only the window."""
+        game = HashLifeGameOfLife(10, 10)
+        for x, y in GLIDER:
+            game.set_cell(x, y, True)
+        assert game.run_until_cycle(200) is None
+        blinker = HashLifeGameOfLife(10, 10)
+        for x in range(3):
+            blinker.set_cell(x + 1000, -1000, True)
+        assert blinker.run_until_cycle(10) == 2
+
+    def test_terminal_interface_counts_generations(self):
+        """Test advance() moves the generation counter of the interface."""
+        interface = TerminalInterface(10, 10, 0, None, engine="hashlife")
+        interface.step()
+        interface.game.advance(1024)
+        assert interface.generation == 1025
@@ -0,0 +1,57 @@
+"""Tests for the memory-mapped out-of-core engine."""
+
+import tracemalloc
+
+from momo.bitboard import BitboardGameOfLife
+from momo.mmap_engine import MappedGameOfLife
+
+
+class TestMappedGameOfLife:
+    """Tests for MappedGameOfLife class."""
+
+    def test_matches_bitboard_engine(self):
+        """Test in-place stepping matches the in-memory engine."""
+        with MappedGameOfLife(45, 30, seed=6, randomize=True) as game:
+            reference = BitboardGameOfLife(45, 30, seed=6, randomize=True)
+            game.step(20)
+            reference.step(20)
+            assert game.grid == reference.grid
+            assert game.changed is None
+
+    def test_grid_is_stored_in_file(self, tmp_path):
+        """Test the backing file holds the bit-packed rows."""
+        path = tmp_path / "world.bin"
+        game = MappedGameOfLife(12, 3, path=str(path))
+        game.set_row_bits(1, 0b1000_0000_0001)
+        game.close()
+        assert path.read_bytes() == bytes([0, 0, 0x01, 0x08, 0, 0])
+
+    def test_randomize_writes_rows(self, monkeypatch):
+        """Test randomizing never builds the whole grid of bools."""
+        def refuse(self, rows):
+            raise AssertionError("whole grid assigned")
+
+        monkeypatch.setattr(MappedGameOfLife, "grid", MappedGameOfLife.grid.setter(refuse))
+        with MappedGameOfLife(30, 20, seed=1, randomize=True) as game:
+            assert game.get_row_bits(0) == BitboardGameOfLife(30, 20, seed=1, randomize=True).rows[0]
+
+    def test_clear_never_allocates_the_grid(self):
+        """Test clearing zeroes the file without building the whole grid in memory."""
+        with MappedGameOfLife(4000, 4000) as game:
+            game.set_row_bits(7, 0b1011)
+            game.set_cell(3999, 3999, True)
+            tracemalloc.start()
+            try:
+                game.clear()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert peak < 4000 * 4000 // 8 // 10
+            assert game.get_row_bits(7) == 0
+            assert game.get_cell(3999, 3999) is False
+
+    def test_close_twice(self):
+        """Test closing twice is harmless."""
+        game = MappedGameOfLife(8, 8)
+        game.close()
+        game.close()
@@ -0,0 +1,29 @@
+"""Tests for the multi-core shared-memory engine."""
+
+from momo.bitboard import BitboardGameOfLife
+from momo.parallel import ParallelGameOfLife
+
+
+class TestParallelGameOfLife:
+    """Tests for ParallelGameOfLife class."""
+
+    def test_matches_serial_engine(self):
+        """Test strips stepped by several workers match the serial result."""
+        with ParallelGameOfLife(70, 45, seed=11, randomize=True, workers=3) as game:
+            serial = BitboardGameOfLife(70, 45, seed=11, randomize=True)
+            game.step(15)
+            serial.step(15)
+            assert game.grid == serial.grid
+            assert game.generation == 15
+
+    def test_more_workers_than_rows(self):
+        """Test the worker count is capped at the number of rows."""
+        with ParallelGameOfLife(10, 2, workers=8) as game:
+            assert game.workers == 2
+
+    def test_close_releases_memory(self):
+        """Test closing twice is harmless."""
+        game = ParallelGameOfLife(8, 8, workers=2)
+        game.step()
+        game.close()
+        game.close()
@@ -0,0 +1,105 @@
+"""Tests for RLE and plaintext pattern files."""
+
+import io
+
+import pytest
+from momo import patterns
+from momo.core import GameOfLife
+from momo.engines import create_game
+from momo.patterns import load_pattern, pattern_rule, pattern_size, read_cells, read_rle, save_cells, save_rle
+
+GLIDER_RLE = """#N Glider
+#C A comment
+x = 3, y = 3, rule = B3/S23
+bo$2bo$3o!
+"""
+GLIDER_CELLS = """!Name: Glider
+.O
+..O
+OOO
+"""
+
+
+def test_read_rle_rows():
+    """Test RLE runs are decoded into packed rows."""
+    width, height, rule, rows = read_rle(io.StringIO(GLIDER_RLE))
+    assert (width, height, rule) == (3, 3, "B3/S23")
+    assert list(rows) == [(0, 0b010), (1, 0b100), (2, 0b111)]
+
+
+def test_read_rle_blank_rows_and_split_counts(monkeypatch):
+    """Test multi-row skips and run counts split across chunks."""
+    monkeypatch.setattr(patterns, "CHUNK_SIZE", 2)
+    _, _, rule, rows = read_rle(io.StringIO("x = 12, y = 4\n12o3$b\n2o!"))
+    assert rule is None
+    assert list(rows) == [(0, 0xFFF), (3, 0b110)]
+
+
+def test_read_rle_rejects_bad_header():
+    """Test a missing header is reported."""
+    with pytest.raises(ValueError):
+        read_rle(io.StringIO("bo$2bo$3o!\n"))
+
+
+def test_read_cells_rows():
+    """Test plaintext rows and size are read."""
+    width, height, rule, rows = read_cells(io.StringIO(GLIDER_CELLS))
+    assert (width, height, rule) == (3, 3, None)
+    assert list(rows) == [(0, 0b010), (1, 0b100), (2, 0b111)]
+
+
+@pytest.mark.parametrize("engine", ["list", "bitboard", "sparse", "hashlife"])
+def test_load_pattern_into_engine(tmp_path, engine):
+    """Test patterns are placed at an offset on every engine."""
+    path = tmp_path / "glider.rle"
+    path.write_text(GLIDER_RLE)
+    game = create_game(engine, 8, 8)
+    game.set_cell(7, 7, True)
+    assert load_pattern(path, game, 2, 1) == (3, 3)
+    assert [game.get_row_bits(y) for y in range(5)] == [0, 0b01000, 0b10000, 0b11100, 0]
+    assert game.get_cell(7, 7) is False
+
+
+def test_load_pattern_centers_and_wraps(tmp_path):
+    """Test the default placement is centered and offsets wrap."""
+    path = tmp_path / "glider.cells"
+    path.write_text(GLIDER_CELLS)
+    game = GameOfLife(7, 7)
+    load_pattern(path, game)
+    assert game.get_cell(3, 2) and game.get_cell(4, 3)
+    load_pattern(path, game, 6, 6)
+    assert game.get_cell(0, 6) and game.get_cell(1, 0)
+    with pytest.raises(ValueError):
+        load_pattern(path, GameOfLife(2, 2))
+    with pytest.raises(ValueError):
+        load_pattern(tmp_path / "glider.png", game)
+
+
+@pytest.mark.parametrize("save, suffix", [(save_rle, ".rle"), (save_cells, ".cells")])
+def test_save_round_trip(tmp_path, save, suffix):
+    """Test saved grids load back identically."""
+    game = GameOfLife(40, 12)
+    game.randomize(seed=5)
+    path = tmp_path / ("soup" + suffix)
+    save(game, path)
+    loaded = GameOfLife(40, 12)
+    load_pattern(path, loaded, 0, 0)
+    assert loaded.grid == game.grid
+
+
+def test_save_rle_line_length(tmp_path):
+    """Test RLE lines stay within the recommended length."""
+    game = GameOfLife(200, 3)
+    game.randomize(seed=1)
+    path = tmp_path / "wide.rle"
+    save_rle(game, path)
+    assert max(len(line) for line in path.read_text().splitlines()) <= 70
+    assert pattern_size(path) == (200, 3)
+
+
+def test_save_rle_records_game_rule(tmp_path):
+    """Test the RLE header names the rule the game plays."""
+    path = tmp_path / "highlife.rle"
+    save_rle(GameOfLife(4, 4, rule="S23/B36"), path)
+    assert path.read_text().splitlines()[0] == "x = 4, y = 4, rule = B36/S23"
+    assert pattern_rule(path) == "B36/S23"
@@ -0,0 +1,114 @@
+"""Tests for delta-encoded recordings and replay."""
+
+import pytest
+from momo.bitboard import BitboardGameOfLife
+from momo.recording import Recorder, Replay, _decode_flips, _encode_flips
+
+
+def record_run(path, generations, keyframe_interval=10, seed=2):
+    """Record a soup and return the grid after every generation."""
+    game = BitboardGameOfLife(24, 16)
+    game.randomize(seed=seed)
+    frames = [game.grid]
+    with Recorder(path, game, keyframe_interval) as recorder:
+        for _ in range(generations):
+            game.step()
+            recorder.record()
+            frames.append(game.grid)
+    return frames
+
+
+def test_flip_encoding_round_trip():
+    """Test flipped cells survive the varint gap encoding."""
+    before = [0b1, 0, 1 << 200]
+    after = [0b110, 1 << 150, 0]
+    payload = _encode_flips(before, after, 300)
+    assert list(_decode_flips(payload)) == [0, 1, 2, 450, 800]
+
+
+def test_replay_seeks_every_generation(tmp_path):
+    """Test seeking in any order reproduces the recorded grids."""
+    path = tmp_path / "run.rec"
+    frames = record_run(path, 35)
+    with Replay(path) as replay:
+        assert replay.last_generation == 35
+        for generation in [0, 35, 7, 9, 10, 11, 3, 21, 20, 34]:
+            replay.seek(generation)
+            assert replay.generation == generation
+            assert replay.grid == frames[generation]
+
+
+def test_replay_steps_forward_and_clamps(tmp_path):
+    """Test stepping plays the run and stops at its end."""
+    path = tmp_path / "run.rec"
+    frames = record_run(path, 5)
+    with Replay(path) as replay:
+        replay.step(2)
+        assert replay.grid == frames[2]
+        assert replay.changed == {(x, y) for y in range(16) for x in range(24)
+                                  if frames[0][y][x] != frames[2][y][x]}
+        replay.step(10)
+        assert replay.generation == 5
+        assert replay.grid == frames[5]
+
+
+def test_replay_is_read_only(tmp_path):
+    """Test edits are refused, so seeking keeps matching the recording."""
+    path = tmp_path / "run.rec"
+    frames = record_run(path, 5)
+    with Replay(path) as replay:
+        replay.seek(2)
+        for edit in (replay.clear, replay.randomize, lambda: replay.set_cell(0, 0, True),
+                     lambda: replay.set_row_bits(0, 1), lambda: replay.set_rows([(0, 1)])):
+            with pytest.raises(TypeError):
+                edit()
+        with pytest.raises(TypeError):
+            replay.grid = frames[0]
+        replay.seek(4)
+        assert replay.grid == frames[4]
+
+
+def test_batched_records_show_latest_state(tmp_path):
+    """Test generations between records show the earlier record."""
+    path = tmp_path / "run.rec"
+    game = BitboardGameOfLife(10, 10)
+    game.randomize(seed=1)
+    with Recorder(path, game) as recorder:
+        game.step(4)
+        recorder.record(4)
+    with Replay(path) as replay:
+        replay.seek(3)
+        assert replay.get_row_bits(0) == BitboardGameOfLife(10, 10, seed=1, randomize=True).rows[0]
+        replay.seek(4)
+        assert replay.grid == game.grid
+
+
+def test_deltas_are_small(tmp_path):
+    """Test a still life records almost nothing per generation."""
+    path = tmp_path / "still.rec"
+    game = BitboardGameOfLife(200, 200)
+    game.set_cell(5, 5, True)
+    with Recorder(path, game) as recorder:
+        for _ in range(500):
+            game.step()
+            recorder.record()
+    assert path.stat().st_size < 500 * 16 + 1000
+
+
+def test_truncated_recording_is_readable(tmp_path):
+    """Test an interrupted recording replays up to its last whole record."""
+    path = tmp_path / "run.rec"
+    frames = record_run(path, 8)
+    path.write_bytes(path.read_bytes()[:-1])
+    with Replay(path) as replay:
+        replay.seek(8)
+        assert replay.generation == 7
+        assert replay.grid == frames[7]
+
+
+def test_rejects_other_files(tmp_path):
+    """Test files that are not recordings are rejected."""
+    path = tmp_path / "noise.rec"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        Replay(path)
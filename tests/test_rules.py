@@ -0,0 +1,98 @@
+"""Tests for Life-like rules."""
+
+import pickle
+import random
+
+import pytest
+from momo.bitboard import next_row
+from momo.core import GameOfLife
+from momo.engines import create_game
+from momo.rules import LIFE, parse_rule
+
+
+def naive_step(grid, rule):
+    """Step a grid of booleans one generation, cell by cell."""
+    height, width = len(grid), len(grid[0])
+    after = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            neighbors = sum(grid[(y + dy) % height][(x + dx) % width]
+                            for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
+            row.append(neighbors in (rule.survival if grid[y][x] else rule.birth))
+        after.append(row)
+    return after
+
+
+@pytest.mark.parametrize("text", ["B3/S23", "b3/s23", "S23/B3", "23/3", " B3/S32 "])
+def test_parse_notations(text):
+    """Test the accepted spellings of Conway's rule."""
+    rule = parse_rule(text)
+    assert rule == LIFE
+    assert str(rule) == "B3/S23"
+    assert rule.birth == {3} and rule.survival == {2, 3}
+
+
+@pytest.mark.parametrize("text", ["", "B9/S23", "B3S23", "life", "B3/S2/3"])
+def test_parse_rejects_malformed(text):
+    """Test malformed notation raises ValueError."""
+    with pytest.raises(ValueError):
+        parse_rule(text)
+
+
+def test_table_layout():
+    """Test the table is indexed by 9 * alive + neighbors."""
+    rule = parse_rule("B36/S23")
+    assert [n for n in range(9) if rule.table[n]] == [3, 6]
+    assert [n for n in range(9) if rule.table[9 + n]] == [2, 3]
+
+
+@pytest.mark.parametrize("text", ["B3/S23", "B36/S23", "B3678/S34678", "B0/S8", "B/S", "B012345678/S012345678"])
+def test_kernel_matches_table(text):
+    """Test the bit-sliced kernel agrees with the table on every cell."""
+    rule = parse_rule(text)
+    width = 23
+    mask = (1 << width) - 1
+    rng = random.Random(text)
+    for _ in range(20):
+        above, row, below = (rng.getrandbits(width) for _ in range(3))
+        result = next_row(above, row, below, width, mask, rule)
+        for x in range(width):
+            alive = row >> x & 1
+            neighbors = sum(bits >> ((x + dx) % width) & 1
+                            for bits in (above, row, below) for dx in (-1, 0, 1)) - alive
+            assert result >> x & 1 == rule.table[9 * alive + neighbors]
+
+
+def test_pickle_round_trip():
+    """Test rules survive pickling despite their compiled kernel."""
+    rule = parse_rule("B36/S23")
+    assert pickle.loads(pickle.dumps(rule)) == rule
+
+
+def test_list_engine_births_from_nothing():
+    """Test B0 rules re-evaluate an empty grid."""
+    game = GameOfLife(9, 9, rule="B0/S")
+    game.step()
+    assert game.population() == 81
+    game.step()
+    assert game.population() == 0
+
+
+@pytest.mark.parametrize("engine", ["sparse", "hashlife"])
+def test_unbounded_engines_reject_b0(engine):
+    """Test engines that skip empty space refuse B0 rules."""
+    with pytest.raises(ValueError):
+        create_game(engine, 8, 8, rule="B0/S8")
+
+
+@pytest.mark.parametrize("text", ["B36/S23", "B3678/S34678", "B2/S", "B0/S8"])
+def test_list_engine_matches_naive(text):
+    """Test the tiled list engine plays other rules like a naive stepper."""
+    game = GameOfLife(19, 13, seed=6, randomize=True, rule=text)
+    grid = game.grid
+    for _ in range(10):
+        grid = naive_step(grid, game.rule)
+    game.step(4)
+    game.step(6)
+    assert game.grid == grid
@@ -0,0 +1,71 @@
+"""Tests for the fixed-timestep scheduler."""
+
+import pytest
+from momo.scheduler import Scheduler
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestScheduler:
+    """Tests for Scheduler class."""
+
+    def test_generations_follow_deadlines(self):
+        """Test generations become due on a fixed timestep."""
+        clock = FakeClock()
+        scheduler = Scheduler(10, 5, clock=clock)
+        assert scheduler.due_generations() == 0
+        clock.now += 0.1
+        assert scheduler.due_generations() == 1
+        assert scheduler.due_generations() == 0
+        clock.now += 0.35
+        assert scheduler.due_generations() == 3
+        clock.now += 0.05
+        assert scheduler.due_generations() == 1
+
+    def test_backlog_is_capped(self):
+        """Test a long stall returns at most max_batch generations."""
+        clock = FakeClock()
+        scheduler = Scheduler(100, 10, max_batch=20, clock=clock)
+        clock.now += 60
+        assert scheduler.due_generations() == 20
+        assert scheduler.due_generations() == 0
+
+    def test_unlimited_generations(self):
+        """Test gps=None makes one generation due on every call without sleeping."""
+        scheduler = Scheduler(None, 30, clock=FakeClock())
+        assert scheduler.due_generations() == 1
+        assert scheduler.sleep_time() == 0.0
+
+    def test_frames_are_dropped_when_behind(self):
+        """Test slow rendering skips missed frames instead of bunching them."""
+        clock = FakeClock()
+        scheduler = Scheduler(1, 10, clock=clock)
+        assert scheduler.frame_due() is True
+        assert scheduler.frame_due() is False
+        clock.now += 0.55
+        assert scheduler.frame_due() is True
+        assert scheduler.dropped_frames == 4
+        assert scheduler.frame_due() is False
+        assert scheduler.sleep_time() == pytest.approx(0.05)
+
+    def test_sleep_while_paused_waits_for_frames(self):
+        """Test a paused simulation only wakes up for frames."""
+        clock = FakeClock()
+        scheduler = Scheduler(1000, 4, clock=clock)
+        scheduler.frame_due()
+        assert scheduler.sleep_time(paused=True) == pytest.approx(0.25)
+
+    def test_invalid_rates(self):
+        """Test invalid rates are rejected."""
+        with pytest.raises(ValueError):
+            Scheduler(10, 0)
+        with pytest.raises(ValueError):
+            Scheduler(-1, 30)
@@ -0,0 +1,72 @@
+"""Tests for the sparse live-cell engine."""
+
+from momo.core import zobrist_key
+from momo.sparse import SparseGameOfLife
+
+GLIDER = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+
+class TestSparseGameOfLife:
+    """Tests for SparseGameOfLife class."""
+
+    def test_stores_only_live_cells(self):
+        """Test a huge world costs nothing until cells are set."""
+        game = SparseGameOfLife(100_000, 100_000)
+        assert game.live == set()
+        for x, y in GLIDER:
+            game.set_cell(x, y, True)
+        assert len(game.live) == 5
+
+    def test_glider_on_huge_torus(self):
+        """Test a glider crosses the wrap-around edge of a huge torus."""
+        game = SparseGameOfLife(100_000, 100_000)
+        for x, y in GLIDER:
+            game.set_cell((x - 3) % 100_000, (y - 3) % 100_000, True)
+        for _ in range(16):
+            game.step()
+        assert game.live == {(x + 1, y + 1) for x, y in GLIDER}
+
+    def test_unbounded_plane_does_not_wrap(self):
+        """Test cells leave the window on the plane instead of wrapping."""
+        game = SparseGameOfLife(8, 8, wrap=False)
+        for x, y in GLIDER:
+            game.set_cell(x, y, True)
+        for _ in range(40):
+            game.step()
+        assert game.live == {(x + 10, y + 10) for x, y in GLIDER}
+        assert all(not cell for row in game.grid for cell in row)
+        assert game.get_cell(11, 10) is True
+
+    def test_plane_negative_coordinates(self):
+        """Test the plane accepts cells at negative coordinates."""
+        game = SparseGameOfLife(4, 4, wrap=False)
+        for x in (-1, 0, 1):
+            game.set_cell(x, -5, True)
+        game.step()
+        assert game.live == {(0, -6), (0, -5), (0, -4)}
+
+    def test_glider_leaving_window_is_not_a_cycle(self):
+        """Test cycle detection hashes cells outside the window on the plane."""
+        game = SparseGameOfLife(10, 10, wrap=False)
+        for x, y in GLIDER:
+            game.set_cell(x, y, True)
+        assert game.run_until_cycle(100) is None
+
+    def test_state_hash_visits_only_live_cells(self, monkeypatch):
+        """Test hashing a huge torus costs its population, not its height."""
+        game = SparseGameOfLife(100_000, 100_000)
+        for x, y in GLIDER:
+            game.set_cell(x + 50_000, y, True)
+        monkeypatch.setattr(SparseGameOfLife, "get_row_bits", None)
+        expected = 0
+        for x, y in GLIDER:
+            expected ^= zobrist_key(y * 100_000 + x + 50_000)
+        assert game.state_hash() == expected
+
+    def test_population_visits_only_live_cells(self, monkeypatch):
+        """Test counting a huge torus costs its population, not its height."""
+        game = SparseGameOfLife(100_000, 100_000)
+        for x, y in GLIDER:
+            game.set_cell(x, y + 70_000, True)
+        monkeypatch.setattr(SparseGameOfLife, "get_row_bits", None)
+        assert game.population() == 5
@@ -0,0 +1,75 @@
+"""Tests for phase statistics and metrics export."""
+
+import io
+import json
+
+import pytest
+from momo.core import GameOfLife
+from momo.stats import MetricsWriter, PhaseStats, percentile
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_percentile_nearest_rank():
+    """Test percentiles pick the nearest-ranked sample."""
+    samples = [5, 1, 4, 2, 3]
+    assert percentile(samples, 50) == 3
+    assert percentile(samples, 90) == 5
+    assert percentile(samples, 0) == 1
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_rolling_window():
+    """Test only the last ``window`` durations count."""
+    stats = PhaseStats(window=3)
+    for seconds in (10.0, 1.0, 2.0, 3.0):
+        stats.record("step", seconds)
+    assert stats.mean("step") == pytest.approx(2.0)
+    assert stats.percentile("step", 99) == 3.0
+    assert stats.mean("render") == 0.0
+    assert stats.summary()["step"]["count"] == 3
+
+
+def test_timer_and_status():
+    """Test timed blocks are recorded and shown in phase order."""
+    clock = FakeClock()
+    stats = PhaseStats(clock=clock)
+    with stats.timer("render"):
+        clock.now += 0.004
+    stats.record("step", 0.002)
+    assert stats.status() == "step 2.0ms render 4.0ms"
+
+
+def test_step_hook_records_steps():
+    """Test GameOfLife.step reports to attached stats."""
+    game = GameOfLife(5, 5)
+    game.stats = PhaseStats()
+    game.step(3)
+    game.step()
+    assert game.stats.summary()["step"]["count"] == 2
+
+
+def test_metrics_writer_interval():
+    """Test records are NDJSON and rate-limited."""
+    clock = FakeClock()
+    stream = io.StringIO()
+    writer = MetricsWriter(stream, interval=1.0, clock=clock)
+    stats = PhaseStats()
+    stats.record("step", 0.5)
+    writer.maybe_write(stats, 7)
+    writer.maybe_write(stats, 8)
+    clock.now += 1.0
+    writer.maybe_write(stats, 9, dropped_frames=2)
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["generation"] for record in records] == [7, 9]
+    assert records[1]["dropped_frames"] == 2
+    assert records[1]["phases"]["step"]["mean"] == 0.5
@@ -0,0 +1,72 @@
+"""Tests for the viewport over large worlds."""
+
+import pytest
+from momo.core import GameOfLife
+from momo.sparse import SparseGameOfLife
+from momo.terminal import TerminalInterface
+from momo.viewport import DENSE, EMPTY, FULL, SPARSE, Viewport
+
+
+class TestViewport:
+    """Tests for Viewport class."""
+
+    def test_sample_reads_window(self):
+        """Test zoom 1 shows the cells of the window."""
+        game = GameOfLife(20, 20)
+        game.set_cell(5, 6, True)
+        view = Viewport(4, 3, x=4, y=5)
+        assert view.sample(game) == [[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 0]]
+
+    def test_sample_wraps_torus(self):
+        """Test a window past the edge wraps around the torus."""
+        game = GameOfLife(10, 10)
+        game.set_cell(0, 0, True)
+        view = Viewport(3, 3, x=9, y=9)
+        assert view.sample(game)[1][1] == 1
+
+    def test_zoomed_out_shades(self):
+        """Test zoomed-out blocks become density shades."""
+        game = GameOfLife(8, 2)
+        game.set_row_bits(0, 0b11110101)
+        game.set_row_bits(1, 0b11111100)
+        view = Viewport(4, 1, zoom=2)
+        # Blocks hold 1, 3, 4 and 4 live cells out of 4
+        assert view.sample(game) == [[SPARSE, DENSE, FULL, FULL]]
+        game.clear()
+        assert view.sample(game) == [[EMPTY] * 4]
+        game.set_cell(7, 1, True)
+        assert view.sample(game, shade=False) == [[0, 0, 0, 1]]
+
+    def test_huge_sparse_world(self):
+        """Test only the visible window of a huge world is read."""
+        game = SparseGameOfLife(100_000, 100_000)
+        game.set_cell(50_001, 70_002, True)
+        view = Viewport(10, 10, x=50_000, y=70_000)
+        assert view.sample(game)[2][1] == 1
+
+    def test_pan_and_zoom(self):
+        """Test panning scales with zoom and zooming keeps the center."""
+        view = Viewport(10, 10)
+        view.pan(1, 2)
+        assert (view.x, view.y) == (4, 8)
+        view.zoom_out()
+        assert view.zoom == 2
+        assert (view.x, view.y) == (-1, 3)
+        view.zoom_in()
+        assert (view.zoom, view.x, view.y) == (1, 4, 8)
+
+    def test_invalid_zoom(self):
+        """Test zoom outside the supported range is rejected."""
+        with pytest.raises(ValueError):
+            Viewport(10, 10, zoom=0)
+
+    def test_terminal_keys(self):
+        """Test pan and zoom keys drive the interface viewport."""
+        interface = TerminalInterface(100, 100, view_width=20, view_height=10)
+        interface.handle_key('l')
+        interface.handle_key('j')
+        assert (interface.viewport.x, interface.viewport.y) == (4, 4)
+        interface.handle_key('-')
+        assert interface.viewport.zoom == 2
+        interface.handle_key(' ')
+        assert interface.paused is True